@@ -1,8 +1,12 @@
 """Evaluation metrics."""
 
 from evals.metrics.retrieval import (
+    METRICS_DTYPE,
     RetrievalMetrics,
+    RetrievalMetricsArray,
+    activate_numba_metrics,
     compute_retrieval_metrics,
+    compute_retrieval_metrics_batch,
     hit_rate,
     mrr,
     ndcg_at_k,
@@ -11,8 +15,12 @@ from evals.metrics.retrieval import (
 )
 
 __all__ = [
+    "METRICS_DTYPE",
     "RetrievalMetrics",
+    "RetrievalMetricsArray",
+    "activate_numba_metrics",
     "compute_retrieval_metrics",
+    "compute_retrieval_metrics_batch",
     "recall_at_k",
     "precision_at_k",
     "hit_rate",
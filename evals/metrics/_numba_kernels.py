@@ -0,0 +1,82 @@
+"""Numba-compiled kernels for retrieval metrics.
+
+Optional backend (pip install numba) enabled via `activate_numba_metrics()`.
+Every metric is derived from one pass over the retrieved IDs, probing a
+sorted copy of the ground truth with binary search.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def compute_hits(retrieved: np.ndarray, ground_truth_sorted: np.ndarray) -> np.ndarray:
+    """Return, for each retrieved position, the index of its match in the
+    sorted unique ground truth array, or -1 if it is not relevant."""
+    num_ground_truth = ground_truth_sorted.shape[0]
+    hits = np.full(retrieved.shape[0], -1, dtype=np.int64)
+    for i in range(retrieved.shape[0]):
+        j = np.searchsorted(ground_truth_sorted, retrieved[i])
+        if j < num_ground_truth and ground_truth_sorted[j] == retrieved[i]:
+            hits[i] = j
+    return hits
+
+
+@njit(cache=True)
+def compute_metrics(
+    retrieved: np.ndarray,
+    ground_truth_sorted: np.ndarray,
+    num_ground_truth: int,
+    k: int,
+    discounts: np.ndarray,
+) -> tuple[float, float, float, float, float, int]:
+    """Compute (recall, precision, hit_rate, reciprocal_rank, ndcg, num_relevant_retrieved).
+
+    `ground_truth_sorted` holds the unique ground truth IDs in ascending order,
+    `num_ground_truth` the original length including duplicates, and
+    `discounts` at least max(min(k, len(retrieved)), min(num_ground_truth, k))
+    NDCG position discounts.
+    A reciprocal rank of 0.0 means no ground truth item was retrieved.
+    """
+    num_retrieved = retrieved.shape[0]
+    if num_retrieved == 0 or num_ground_truth == 0:
+        return 0.0, 0.0, 0.0, 0.0, 0.0, 0
+
+    hits = compute_hits(retrieved, ground_truth_sorted)
+    top_k = min(k, num_retrieved)
+
+    # MRR looks at the full retrieved list, not just the top-k
+    reciprocal_rank = 0.0
+    for i in range(num_retrieved):
+        if hits[i] >= 0:
+            reciprocal_rank = 1.0 / (i + 1)
+            break
+
+    seen = np.zeros(ground_truth_sorted.shape[0], dtype=np.bool_)
+    relevant_count = 0
+    num_relevant_retrieved = 0
+    dcg = 0.0
+    for i in range(top_k):
+        j = hits[i]
+        if j >= 0:
+            relevant_count += 1
+            dcg += discounts[i]
+            if not seen[j]:
+                seen[j] = True
+                num_relevant_retrieved += 1
+
+    if relevant_count == 0:
+        return 0.0, 0.0, 0.0, reciprocal_rank, 0.0, 0
+
+    idcg = 0.0
+    for i in range(min(num_ground_truth, k)):
+        idcg += discounts[i]
+
+    return (
+        relevant_count / num_ground_truth,
+        relevant_count / top_k,
+        1.0,
+        reciprocal_rank,
+        dcg / idcg,
+        num_relevant_retrieved,
+    )
@@ -13,11 +13,50 @@ All metrics handle edge cases gracefully:
 - No overlap between lists → 0.0 scores
 """
 
-import math
+from collections.abc import Iterator, Sequence, Set
 from dataclasses import dataclass
+from itertools import chain
 
+import numpy as np
 
-@dataclass
+try:
+    # Optional JIT backend (pip install numba), enabled via activate_numba_metrics()
+    from evals.metrics import _numba_kernels
+except ImportError:
+    _numba_kernels = None
+
+_use_numba = False
+# NDCG position discounts 1 / log2(rank + 1), precomputed for ranks 1..9_999
+_LOG2_DISCOUNTS = (1.0 / np.log2(np.arange(2, 10_001))).astype(np.float64)
+
+
+def _log2_discounts(size: int) -> np.ndarray:
+    """Return the first `size` NDCG discounts.
+
+    Sizes past the shared table get a one-off array instead of growing the
+    table, so one oversized request doesn't pin a huge array in memory.
+    """
+    if size > len(_LOG2_DISCOUNTS):
+        return 1.0 / np.log2(np.arange(2, size + 2, dtype=np.float64))
+    return _LOG2_DISCOUNTS[:size]
+
+
+def activate_numba_metrics(enabled: bool = True) -> None:
+    """Route `compute_retrieval_metrics` through the Numba-compiled kernels.
+
+    Worth enabling for sweeps that compute metrics thousands of times; the
+    first call pays the JIT compilation cost.
+
+    Raises:
+        ImportError: If numba is not installed
+    """
+    global _use_numba
+    if enabled and _numba_kernels is None:
+        raise ImportError("numba is required for the JIT metric backend: pip install numba")
+    _use_numba = enabled
+
+
+@dataclass(slots=True, frozen=True)
 class RetrievalMetrics:
     """Complete set of retrieval evaluation metrics.
 
@@ -46,6 +85,65 @@ class RetrievalMetrics:
     num_relevant_retrieved: int
 
 
+# Structured dtype for contiguous per-query metric records
+METRICS_DTYPE = np.dtype(
+    [
+        ("recall_at_k", np.float64),
+        ("precision_at_k", np.float64),
+        ("hit_rate", np.float64),
+        ("mrr", np.float64),
+        ("ndcg_at_k", np.float64),
+        ("num_retrieved", np.int32),
+        ("num_ground_truth", np.int32),
+        ("num_relevant_retrieved", np.int32),
+    ]
+)
+
+
+@dataclass(slots=True, frozen=True)
+class RetrievalMetricsArray:
+    """Retrieval metrics for a batch of queries, stored column-wise.
+
+    Each attribute mirrors a RetrievalMetrics field as a NumPy array with one
+    entry per query. `mrr` uses NaN where RetrievalMetrics would hold None.
+    Iterating yields RetrievalMetrics lazily, one per query.
+    """
+
+    recall_at_k: np.ndarray
+    precision_at_k: np.ndarray
+    hit_rate: np.ndarray
+    mrr: np.ndarray
+    ndcg_at_k: np.ndarray
+    k: int
+    num_retrieved: np.ndarray
+    num_ground_truth: np.ndarray
+    num_relevant_retrieved: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.recall_at_k)
+
+    def __iter__(self) -> Iterator[RetrievalMetrics]:
+        for q in range(len(self)):
+            mrr_value = float(self.mrr[q])
+            yield RetrievalMetrics(
+                recall_at_k=float(self.recall_at_k[q]),
+                precision_at_k=float(self.precision_at_k[q]),
+                hit_rate=float(self.hit_rate[q]),
+                mrr=None if np.isnan(mrr_value) else mrr_value,
+                ndcg_at_k=float(self.ndcg_at_k[q]),
+                k=self.k,
+                num_retrieved=int(self.num_retrieved[q]),
+                num_ground_truth=int(self.num_ground_truth[q]),
+                num_relevant_retrieved=int(self.num_relevant_retrieved[q]),
+            )
+
+    def to_records(self) -> np.recarray:
+        """Pack the columns into a record array with METRICS_DTYPE."""
+        return np.rec.fromarrays(
+            [getattr(self, name) for name in METRICS_DTYPE.names], dtype=METRICS_DTYPE
+        )
+
+
 def recall_at_k(
     retrieved: list[int],
     ground_truth: list[int],
@@ -69,18 +167,22 @@ def recall_at_k(
         >>> recall_at_k([1, 2, 3], [4, 5], k=3)
         0.0  # No overlap
     """
-    if not ground_truth:
-        return 0.0
+    return _recall_at_k_set(retrieved, set(ground_truth), len(ground_truth), k)
 
-    if not retrieved:
-        return 0.0
 
-    top_k = retrieved[:k]
-    ground_truth_set = set(ground_truth)
+def _recall_at_k_set(
+    retrieved: list[int],
+    ground_truth_set: Set[int],
+    num_ground_truth: int,
+    k: int,
+) -> float:
+    """Recall@k against a prebuilt ground truth set (see `recall_at_k`)."""
+    if not ground_truth_set or not retrieved:
+        return 0.0
 
-    relevant_retrieved = sum(1 for item in top_k if item in ground_truth_set)
+    relevant_retrieved = sum(1 for item in retrieved[:k] if item in ground_truth_set)
 
-    return relevant_retrieved / len(ground_truth)
+    return relevant_retrieved / num_ground_truth
 
 
 def precision_at_k(
@@ -104,15 +206,19 @@ def precision_at_k(
         >>> precision_at_k([1, 2, 3, 4], [2, 3], k=3)
         0.667  # 2 of 3 retrieved are relevant
     """
-    if not retrieved:
-        return 0.0
+    return _precision_at_k_set(retrieved, set(ground_truth), k)
 
-    if not ground_truth:
+
+def _precision_at_k_set(
+    retrieved: list[int],
+    ground_truth_set: Set[int],
+    k: int,
+) -> float:
+    """Precision@k against a prebuilt ground truth set (see `precision_at_k`)."""
+    if not retrieved or not ground_truth_set:
         return 0.0
 
     top_k = retrieved[:k]
-    ground_truth_set = set(ground_truth)
-
     relevant_retrieved = sum(1 for item in top_k if item in ground_truth_set)
 
     return relevant_retrieved / len(top_k)
@@ -141,13 +247,19 @@ def hit_rate(
         >>> hit_rate([1, 2, 3], [4, 5], k=3)
         0.0
     """
-    if not retrieved or not ground_truth:
-        return 0.0
+    return _hit_rate_set(retrieved, set(ground_truth), k)
 
-    top_k = retrieved[:k]
-    ground_truth_set = set(ground_truth)
 
-    return 1.0 if any(item in ground_truth_set for item in top_k) else 0.0
+def _hit_rate_set(
+    retrieved: list[int],
+    ground_truth_set: Set[int],
+    k: int,
+) -> float:
+    """Hit rate against a prebuilt ground truth set (see `hit_rate`)."""
+    if not retrieved or not ground_truth_set:
+        return 0.0
+
+    return 1.0 if any(item in ground_truth_set for item in retrieved[:k]) else 0.0
 
 
 def mrr(
@@ -175,10 +287,16 @@ def mrr(
         >>> mrr([1, 2, 3], [4, 5])
         None  # No match
     """
-    if not retrieved or not ground_truth:
-        return None
+    return _mrr_set(retrieved, set(ground_truth))
+
 
-    ground_truth_set = set(ground_truth)
+def _mrr_set(
+    retrieved: list[int],
+    ground_truth_set: Set[int],
+) -> float | None:
+    """Reciprocal rank against a prebuilt ground truth set (see `mrr`)."""
+    if not retrieved or not ground_truth_set:
+        return None
 
     for rank, item in enumerate(retrieved, start=1):
         if item in ground_truth_set:
@@ -217,29 +335,33 @@ def ndcg_at_k(
         >>> ndcg_at_k([1, 2, 3], [4, 5], k=3)
         0.0  # No relevant items
     """
-    if not retrieved or not ground_truth:
-        return 0.0
-
-    ground_truth_set = set(ground_truth)
-    top_k = retrieved[:k]
+    return _ndcg_at_k_set(retrieved, set(ground_truth), len(ground_truth), k)
 
-    # Calculate DCG
-    dcg = 0.0
-    for rank, item in enumerate(top_k, start=1):
-        if item in ground_truth_set:
-            dcg += 1.0 / math.log2(rank + 1)
 
-    if dcg == 0.0:
+def _ndcg_at_k_set(
+    retrieved: list[int],
+    ground_truth_set: Set[int],
+    num_ground_truth: int,
+    k: int,
+) -> float:
+    """NDCG@k against a prebuilt ground truth set (see `ndcg_at_k`)."""
+    if not retrieved or not ground_truth_set:
         return 0.0
 
-    # Calculate IDCG (ideal DCG - all relevant items ranked first)
-    num_relevant = min(len(ground_truth), k)
-    idcg = sum(1.0 / math.log2(rank + 1) for rank in range(1, num_relevant + 1))
-
-    if idcg == 0.0:
+    top_k = retrieved[:k]
+    relevant = np.fromiter(
+        (item in ground_truth_set for item in top_k), dtype=bool, count=len(top_k)
+    )
+    if not relevant.any():
         return 0.0
 
-    return dcg / idcg
+    # IDCG is the ideal DCG with all relevant items ranked first
+    num_relevant = min(num_ground_truth, k)
+    discounts = _log2_discounts(max(len(top_k), num_relevant))
+    dcg = discounts[: len(top_k)][relevant].sum()
+    idcg = discounts[:num_relevant].sum()
+
+    return float(dcg / idcg)
 
 
 def compute_retrieval_metrics(
@@ -275,15 +397,39 @@ def compute_retrieval_metrics(
     if k < 1:
         raise ValueError(f"k must be >= 1, got {k}")
 
-    ground_truth_set = set(ground_truth)
-    top_k_set = set(retrieved[:k])
-    num_relevant_retrieved = len(ground_truth_set & top_k_set)
+    if _use_numba:
+        return _compute_retrieval_metrics_numba(retrieved, ground_truth, k)
+
+    ground_truth_set = frozenset(ground_truth)
+    num_ground_truth = len(ground_truth)
+    top_k = retrieved[:k]
 
-    recall = recall_at_k(retrieved, ground_truth, k)
-    precision = precision_at_k(retrieved, ground_truth, k)
-    hit = hit_rate(retrieved, ground_truth, k)
-    reciprocal_rank = mrr(retrieved, ground_truth)
-    ndcg = ndcg_at_k(retrieved, ground_truth, k)
+    # Single pass over the top-k: every @k metric derives from the hit ranks
+    hit_ranks: list[int] = []
+    relevant_items: set[int] = set()
+    if ground_truth_set:
+        for rank, item in enumerate(top_k):
+            if item in ground_truth_set:
+                hit_ranks.append(rank)
+                relevant_items.add(item)
+
+    if hit_ranks:
+        num_relevant = min(num_ground_truth, k)
+        discounts = _log2_discounts(max(len(top_k), num_relevant))
+        recall = len(hit_ranks) / num_ground_truth
+        precision = len(hit_ranks) / len(top_k)
+        hit = 1.0
+        reciprocal_rank: float | None = 1.0 / (hit_ranks[0] + 1)
+        ndcg = float(discounts[hit_ranks].sum() / discounts[:num_relevant].sum())
+    else:
+        recall = precision = hit = ndcg = 0.0
+        # MRR looks at the full list, so keep scanning past the top-k
+        reciprocal_rank = None
+        if ground_truth_set:
+            for rank, item in enumerate(retrieved[k:], start=k + 1):
+                if item in ground_truth_set:
+                    reciprocal_rank = 1.0 / rank
+                    break
 
     return RetrievalMetrics(
         recall_at_k=recall,
@@ -293,6 +439,153 @@ def compute_retrieval_metrics(
         ndcg_at_k=ndcg,
         k=k,
         num_retrieved=len(retrieved),
+        num_ground_truth=num_ground_truth,
+        num_relevant_retrieved=len(relevant_items),
+    )
+
+
+def _compute_retrieval_metrics_numba(
+    retrieved: list[int],
+    ground_truth: list[int],
+    k: int,
+) -> RetrievalMetrics:
+    """Compute all metrics for one query with the Numba kernels."""
+    recall, precision, hit, reciprocal_rank, ndcg, num_relevant_retrieved = (
+        _numba_kernels.compute_metrics(
+            np.asarray(retrieved, dtype=np.int64),
+            np.unique(np.asarray(ground_truth, dtype=np.int64)),
+            len(ground_truth),
+            k,
+            _log2_discounts(max(min(k, len(retrieved)), min(len(ground_truth), k))),
+        )
+    )
+
+    return RetrievalMetrics(
+        recall_at_k=recall,
+        precision_at_k=precision,
+        hit_rate=hit,
+        mrr=reciprocal_rank if reciprocal_rank > 0.0 else None,
+        ndcg_at_k=ndcg,
+        k=k,
+        num_retrieved=len(retrieved),
         num_ground_truth=len(ground_truth),
         num_relevant_retrieved=num_relevant_retrieved,
     )
+
+
+def compute_retrieval_metrics_batch(
+    retrieved: Sequence[Sequence[int]],
+    ground_truth: Sequence[Sequence[int]],
+    k: int,
+) -> RetrievalMetricsArray:
+    """Compute all retrieval metrics for many queries at once.
+
+    Vectorized equivalent of calling `compute_retrieval_metrics` per query.
+    Ragged inputs are padded into 2D arrays so every metric is computed with
+    a handful of NumPy reductions instead of a Python loop per query.
+
+    Args:
+        retrieved: Per-query ordered lists of retrieved chunk IDs
+        ground_truth: Per-query lists of ground truth chunk IDs
+        k: Number of top results to consider for @k metrics
+
+    Returns:
+        RetrievalMetricsArray with one entry per query, in input order
+
+    Raises:
+        ValueError: If k < 1 or the two sequences differ in length
+    """
+    if k < 1:
+        raise ValueError(f"k must be >= 1, got {k}")
+    if len(retrieved) != len(ground_truth):
+        raise ValueError(
+            f"retrieved and ground_truth must have the same length, "
+            f"got {len(retrieved)} and {len(ground_truth)}"
+        )
+
+    num_queries = len(retrieved)
+    num_retrieved = np.fromiter((len(r) for r in retrieved), dtype=np.int32, count=num_queries)
+    num_ground_truth = np.fromiter(
+        (len(g) for g in ground_truth), dtype=np.int32, count=num_queries
+    )
+    if not num_queries:
+        empty = np.zeros(0, dtype=np.float64)
+        return RetrievalMetricsArray(
+            recall_at_k=empty,
+            precision_at_k=empty,
+            hit_rate=empty,
+            mrr=empty,
+            ndcg_at_k=empty,
+            k=k,
+            num_retrieved=num_retrieved,
+            num_ground_truth=num_ground_truth,
+            num_relevant_retrieved=num_retrieved,
+        )
+
+    # Flatten the ragged inputs, remembering each ID's query row and rank
+    total_retrieved = int(num_retrieved.sum())
+    retrieved_flat = np.fromiter(
+        chain.from_iterable(retrieved), dtype=np.int64, count=total_retrieved
+    )
+    gt_flat = np.fromiter(
+        chain.from_iterable(ground_truth), dtype=np.int64, count=int(num_ground_truth.sum())
+    )
+    retrieved_rows = np.repeat(np.arange(num_queries), num_retrieved)
+    gt_rows = np.repeat(np.arange(num_queries), num_ground_truth)
+    retrieved_ranks = np.arange(total_retrieved) - np.repeat(
+        np.cumsum(num_retrieved) - num_retrieved, num_retrieved
+    )
+
+    # Dense-code IDs so each (query, id) pair packs into one sortable int64 key,
+    # then look every retrieved key up in the sorted unique ground truth keys
+    vocab = np.unique(np.concatenate((retrieved_flat, gt_flat)))
+    width = max(vocab.size, 1)
+    retrieved_keys = retrieved_rows * width + np.searchsorted(vocab, retrieved_flat)
+    gt_keys = np.unique(gt_rows * width + np.searchsorted(vocab, gt_flat))
+    if gt_keys.size:
+        positions = np.minimum(np.searchsorted(gt_keys, retrieved_keys), gt_keys.size - 1)
+        found = gt_keys[positions] == retrieved_keys
+    else:
+        found = np.zeros(total_retrieved, dtype=bool)
+
+    max_retrieved = max(int(num_retrieved.max()), 1)
+    hits = np.zeros((num_queries, max_retrieved), dtype=bool)
+    hits[retrieved_rows, retrieved_ranks] = found
+    top_k_hits = hits[:, :k]
+    relevant_counts = top_k_hits.sum(axis=1)
+
+    # Distinct ground truth items in the top-k, counted per query
+    distinct_keys = np.unique(retrieved_keys[found & (retrieved_ranks < k)])
+    num_relevant_retrieved = np.bincount(distinct_keys // width, minlength=num_queries)
+
+    scored = (num_retrieved > 0) & (num_ground_truth > 0)
+    recall = np.where(scored, relevant_counts / np.maximum(num_ground_truth, 1), 0.0)
+    precision = np.where(
+        scored, relevant_counts / np.maximum(np.minimum(k, num_retrieved), 1), 0.0
+    )
+    hit = np.where(scored & (relevant_counts > 0), 1.0, 0.0)
+
+    # MRR looks at the full retrieved list, not just the top-k
+    has_match = hits.any(axis=1)
+    reciprocal_ranks = 1.0 / (hits.argmax(axis=1) + 1)
+
+    # Sequential cumulative sums so a perfect ranking yields DCG == IDCG exactly
+    # Tables only need to reach the longest top-k list and ground truth, not k
+    max_ideal = min(k, int(num_ground_truth.max()))
+    discounts = _log2_discounts(max(top_k_hits.shape[1], max_ideal))
+    dcg = np.cumsum(top_k_hits * discounts[: top_k_hits.shape[1]], axis=1)[:, -1]
+    ideal_discounts = np.concatenate(([0.0], np.cumsum(discounts[:max_ideal])))
+    idcg = ideal_discounts[np.minimum(num_ground_truth, k)]
+    ndcg = np.where(scored & (dcg > 0.0), dcg / np.where(idcg > 0.0, idcg, 1.0), 0.0)
+
+    return RetrievalMetricsArray(
+        recall_at_k=recall,
+        precision_at_k=precision,
+        hit_rate=hit,
+        mrr=np.where(has_match, reciprocal_ranks, np.nan),
+        ndcg_at_k=ndcg,
+        k=k,
+        num_retrieved=num_retrieved,
+        num_ground_truth=num_ground_truth,
+        num_relevant_retrieved=num_relevant_retrieved.astype(np.int32),
+    )
@@ -4,17 +4,137 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
+
+try:
+    # Optional linear-time DFA matcher (pip install google-re2) for multi-term search
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
+
+# A stdlib `re` alternation is slower than one str.find pass per term, so
+# search_terms() only scans for all terms at once when re2 is available
+_SINGLE_SCAN_SEARCH = regex_engine is not re
+
 if TYPE_CHECKING:
     from evals.schemas.task import EvalDataset
 
 logger = logging.getLogger(__name__)
 
+# {firstname}-{lastname}[-{title-words}] once the .md extension is removed
+_FILENAME_PATTERN = re.compile(
+    r"^(?P<first>[^-]*)-(?P<last>[^-]*)(?:-(?P<title>.*))?$", re.DOTALL
+)
+_HYPHENS_TO_SPACES = str.maketrans("-", " ")
+
+
+def _find_matching_lines(
+    text: str, query: str, case_sensitive: bool, text_lower: str | None = None
+) -> list[str]:
+    """Return the stripped lines of `text` that contain `query`.
+
+    Searches the whole text with str.find and only slices out the lines
+    around each hit, instead of splitting and lowercasing every line.
+    `text_lower` may carry an already lowercased copy of `text`.
+    """
+    if case_sensitive:
+        haystack, needle = text, query
+    else:
+        haystack = text.lower() if text_lower is None else text_lower
+        needle = query.lower()
+
+    if not needle or "\n" in needle or len(haystack) != len(text):
+        # Empty or multi-line queries, or lowercasing that shifts offsets:
+        # fall back to matching line by line
+        return [
+            line.strip()
+            for line in text.split("\n")
+            if needle in (line if case_sensitive else line.lower())
+        ]
+
+    matches = []
+    pos = haystack.find(needle)
+    while pos != -1:
+        line_start = haystack.rfind("\n", 0, pos) + 1
+        line_end = haystack.find("\n", pos + len(needle))
+        if line_end == -1:
+            line_end = len(haystack)
+        matches.append(text[line_start:line_end].strip())
+        # Each line is reported once, so resume after it
+        pos = haystack.find(needle, line_end)
+
+    return matches
+
+
+@lru_cache(maxsize=64)
+def _compile_alternation(needles: tuple[str, ...]):
+    """Compile an alternation matching any of the literal `needles`."""
+    return regex_engine.compile("|".join(re.escape(needle) for needle in dict.fromkeys(needles)))
+
+
+def _find_matching_lines_multi(
+    text: str, terms: list[str], case_sensitive: bool, text_lower: str | None = None
+) -> dict[str, list[str]]:
+    """Return, per term, the stripped lines of `text` that contain it.
+
+    One scan with an alternation of all terms finds every line holding at
+    least one of them; only those lines are then checked term by term.
+    Terms must be non-empty and free of newlines.
+    """
+    if case_sensitive:
+        haystack, needles = text, terms
+    else:
+        haystack = text.lower() if text_lower is None else text_lower
+        needles = [term.lower() for term in terms]
+
+    matches: dict[str, list[str]] = {term: [] for term in terms}
+    if len(haystack) != len(text):
+        # Lowercasing shifted offsets: search each term on its own
+        for term in terms:
+            matches[term] = _find_matching_lines(text, term, case_sensitive, text_lower)
+        return matches
+
+    pattern = _compile_alternation(tuple(needles))
+    hit = pattern.search(haystack)
+    while hit is not None:
+        line_start = haystack.rfind("\n", 0, hit.start()) + 1
+        line_end = haystack.find("\n", hit.end())
+        if line_end == -1:
+            line_end = len(haystack)
+        line = haystack[line_start:line_end]
+        stripped = text[line_start:line_end].strip()
+        for term, needle in zip(terms, needles):
+            if needle in line:
+                matches[term].append(stripped)
+        # Each line is reported once, so resume after it
+        hit = pattern.search(haystack, line_end)
+
+    return matches
+
+
+@lru_cache(maxsize=256)
+def _read_transcript_text(path: str, mtime_ns: int) -> str:
+    """Read a transcript file, memoized on path and modification time.
+
+    Keying on mtime means an edited file is re-read instead of served stale.
+    """
+    return Path(path).read_text(encoding="utf-8")
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Transcript:
     """Loaded transcript document."""
 
@@ -23,6 +143,14 @@ class Transcript:
     title: str
     text: str
     file_path: str
+    # Lowercased text, filled in by the first case-insensitive search
+    text_lower: str = field(default="", repr=False, compare=False)
+
+    def lowered(self) -> str:
+        """Return the lowercased text, computing it once per transcript."""
+        if not self.text_lower and self.text:
+            object.__setattr__(self, "text_lower", self.text.lower())
+        return self.text_lower
 
 
 class TranscriptLoader:
@@ -51,6 +179,10 @@ class TranscriptLoader:
         else:
             self.transcripts_dir = Path(transcripts_dir)
 
+        # get_transcript_names() memo, keyed on the directory's mtime
+        self._names_mtime_ns: int | None = None
+        self._names: list[str] = []
+
     @staticmethod
     def _get_project_root() -> Path:
         """Get the project root directory."""
@@ -83,7 +215,7 @@ class TranscriptLoader:
                 f"Available transcripts: {available}"
             )
 
-        text = filepath.read_text(encoding="utf-8")
+        text = _read_transcript_text(str(filepath), filepath.stat().st_mtime_ns)
 
         if not text.strip():
             raise ValueError(f"Transcript file is empty: {filepath}")
@@ -112,15 +244,24 @@ class TranscriptLoader:
                 f"Transcripts directory not found: {self.transcripts_dir}"
             )
 
-        transcripts = []
-        for filepath in sorted(self.transcripts_dir.glob("*.md")):
+        filepaths = sorted(self.transcripts_dir.glob("*.md"))
+        if not filepaths:
+            return []
+
+        def load_or_skip(filepath: Path) -> Transcript | None:
             try:
-                transcripts.append(self.load(filepath.name))
+                return self.load(filepath.name)
             except ValueError as e:
                 # Skip empty or invalid files but log the issue
                 logger.warning("Skipping invalid transcript: %s", e)
+                return None
+
+        # Files are independent, so overlap the reads; map() preserves sorted order
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(filepaths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            loaded = list(executor.map(load_or_skip, filepaths))
 
-        return transcripts
+        return [transcript for transcript in loaded if transcript is not None]
 
     def get_transcript_names(self) -> list[str]:
         """Get list of available transcript filenames.
@@ -128,9 +269,20 @@ class TranscriptLoader:
         Returns:
             List of markdown filenames in the transcripts directory
         """
-        if not self.transcripts_dir.exists():
+        try:
+            mtime_ns = os.stat(self.transcripts_dir).st_mtime_ns
+        except FileNotFoundError:
             return []
-        return sorted(f.name for f in self.transcripts_dir.glob("*.md"))
+
+        # Adding, removing or renaming a file bumps the directory mtime
+        if mtime_ns != self._names_mtime_ns:
+            with os.scandir(self.transcripts_dir) as entries:
+                self._names = sorted(
+                    entry.name for entry in entries if entry.name.endswith(".md")
+                )
+            self._names_mtime_ns = mtime_ns
+
+        return list(self._names)
 
     @staticmethod
     def _parse_filename(filename: str) -> tuple[str, str]:
@@ -155,17 +307,11 @@ class TranscriptLoader:
         # Remove .md extension
         name = filename.replace(".md", "")
 
-        # Split on hyphens
-        parts = name.split("-")
-
-        if len(parts) >= 3:
-            # First two parts are speaker name, rest is title
-            speaker_part = " ".join(parts[:2])
-            title_part = " ".join(parts[2:])
-        elif len(parts) == 2:
-            # Could be "firstname-lastname" with no title
-            speaker_part = " ".join(parts)
-            title_part = ""
+        match = _FILENAME_PATTERN.match(name)
+        if match:
+            # First two parts are speaker name, rest (if any) is title
+            speaker_part = f"{match['first']} {match['last']}"
+            title_part = (match["title"] or "").translate(_HYPHENS_TO_SPACES)
         else:
             # Fallback: use whole filename as title
             speaker_part = "Unknown"
@@ -186,7 +332,12 @@ class TranscriptLoader:
 
         return speaker, title
 
-    def search_text(self, query: str, case_sensitive: bool = False) -> list[tuple[Transcript, list[str]]]:
+    def search_text(
+        self,
+        query: str,
+        case_sensitive: bool = False,
+        transcripts: list[Transcript] | None = None,
+    ) -> list[tuple[Transcript, list[str]]]:
         """Search all transcripts for a query string.
 
         Useful for finding relevant sections when curating eval questions.
@@ -194,25 +345,75 @@ class TranscriptLoader:
         Args:
             query: Text to search for
             case_sensitive: Whether to do case-sensitive search
+            transcripts: Preloaded transcripts to search, so repeated searches
+                        skip the directory scan. Defaults to load_all().
 
         Returns:
             List of (transcript, matching_lines) tuples
         """
+        if transcripts is None:
+            transcripts = self.load_all()
+
         results = []
 
-        for transcript in self.load_all():
-            lines = transcript.text.split("\n")
-            matches = []
+        for transcript in transcripts:
+            matches = _find_matching_lines(
+                transcript.text,
+                query,
+                case_sensitive,
+                None if case_sensitive else transcript.lowered(),
+            )
+            if matches:
+                results.append((transcript, matches))
 
-            for line in lines:
-                check_line = line if case_sensitive else line.lower()
-                check_query = query if case_sensitive else query.lower()
+        return results
 
-                if check_query in check_line:
-                    matches.append(line.strip())
+    def search_terms(
+        self,
+        terms: list[str],
+        case_sensitive: bool = False,
+        transcripts: list[Transcript] | None = None,
+    ) -> dict[str, list[tuple[Transcript, list[str]]]]:
+        """Search all transcripts for several query strings at once.
 
-            if matches:
-                results.append((transcript, matches))
+        Equivalent to calling search_text() per term. When re2 is installed,
+        each transcript is scanned once for all terms.
+
+        Args:
+            terms: Texts to search for
+            case_sensitive: Whether to do case-sensitive search
+            transcripts: Preloaded transcripts to search. Defaults to load_all().
+
+        Returns:
+            Dict mapping each term to its list of (transcript, matching_lines) tuples
+        """
+        if transcripts is None:
+            transcripts = self.load_all()
+
+        terms = list(dict.fromkeys(terms))
+        # Empty and multi-line terms can't go through the line-oriented scan
+        scanned = (
+            [term for term in terms if term and "\n" not in term]
+            if _SINGLE_SCAN_SEARCH
+            else []
+        )
+        results: dict[str, list[tuple[Transcript, list[str]]]] = {term: [] for term in terms}
+
+        for transcript in transcripts:
+            text_lower = None if case_sensitive else transcript.lowered()
+            per_term = (
+                _find_matching_lines_multi(transcript.text, scanned, case_sensitive, text_lower)
+                if scanned
+                else {}
+            )
+            for term in terms:
+                matches = per_term.get(term)
+                if matches is None:
+                    matches = _find_matching_lines(
+                        transcript.text, term, case_sensitive, text_lower
+                    )
+                if matches:
+                    results[term].append((transcript, matches))
 
         return results
 
@@ -241,7 +442,6 @@ def load_eval_dataset(filepath: str | Path | None = None) -> EvalDataset:
     if not filepath.exists():
         raise FileNotFoundError(f"Eval dataset not found: {filepath}")
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _json_loads(filepath.read_bytes())
 
     return EvalDataset(**data)
@@ -4,11 +4,12 @@ This module defines the eval cases that test whether an agent correctly
 extracts and applies filters from natural language queries.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExpectedFilters:
     """Expected filter parameters that should be extracted from a query.
 
@@ -23,7 +24,7 @@ class ExpectedFilters:
     end_date: Optional[str] = None  # ISO format string
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EvalCase:
     """A single evaluation test case.
 
@@ -256,7 +257,18 @@ class ToolParamsDataset:
 
     def __init__(self, cases: Optional[list[EvalCase]] = None):
         """Initialize with optional custom cases, defaults to EVAL_CASES."""
-        self.cases = cases if cases is not None else EVAL_CASES
+        # Snapshot as a tuple: iteration and len() never copy, and the
+        # indexes below can't drift from the cases they were built from
+        self.cases: tuple[EvalCase, ...] = tuple(cases if cases is not None else EVAL_CASES)
+
+        # Category and ID indexes built once so lookups don't rescan every case
+        cases_by_category: defaultdict[str, list[EvalCase]] = defaultdict(list)
+        self._cases_by_id: dict[str, EvalCase] = {}
+        for case in self.cases:
+            cases_by_category[case.category].append(case)
+            # First case wins on duplicate IDs, as with a linear scan
+            self._cases_by_id.setdefault(case.id, case)
+        self._cases_by_category = dict(cases_by_category)
 
     def __iter__(self):
         return iter(self.cases)
@@ -266,18 +278,15 @@ class ToolParamsDataset:
 
     def by_category(self, category: str) -> list[EvalCase]:
         """Filter cases by category."""
-        return [c for c in self.cases if c.category == category]
+        return list(self._cases_by_category.get(category, ()))
 
     def categories(self) -> list[str]:
         """Get list of unique categories."""
-        return list(set(c.category for c in self.cases))
+        return list(self._cases_by_category)
 
     def get_by_id(self, case_id: str) -> Optional[EvalCase]:
         """Get a specific case by ID."""
-        for case in self.cases:
-            if case.id == case_id:
-                return case
-        return None
+        return self._cases_by_id.get(case_id)
 
     @property
     def count(self) -> int:
@@ -8,8 +8,13 @@ per-category breakdowns.
 from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
+
 from evals.tasks.tool_params.types import ToolParamsEvalResult
 
+# Result count above which filter outcomes are tallied with NumPy reductions
+VECTORIZED_MIN_RESULTS = 512
+
 
 @dataclass
 class FilterMetrics:
@@ -99,30 +104,16 @@ def _compute_filter_metrics(
     """
     metrics = FilterMetrics(filter_name=filter_name)
 
-    for result in results:
-        if result.error:
-            continue  # Skip errored cases
-
-        # Get expected and actual values
-        expected = getattr(result.expected_filters, filter_name, None)
-        actual = result.actual_filters.get(filter_name)
-
-        expected_applied = expected is not None
-        actual_applied = actual is not None
-
-        if expected_applied and actual_applied:
-            # Check if the match was correct
-            if result.filter_matches.get(filter_name, False):
-                metrics.true_positives += 1
-            else:
-                # Applied but wrong value - count as FP for value accuracy
-                metrics.false_positives += 1
-        elif not expected_applied and not actual_applied:
-            metrics.true_negatives += 1
-        elif expected_applied and not actual_applied:
-            metrics.false_negatives += 1
-        else:  # not expected_applied and actual_applied
-            metrics.false_positives += 1
+    if len(results) > VECTORIZED_MIN_RESULTS:
+        counts = _count_filter_outcomes_vectorized(filter_name, results)
+    else:
+        counts = _count_filter_outcomes(filter_name, results)
+    (
+        metrics.true_positives,
+        metrics.true_negatives,
+        metrics.false_positives,
+        metrics.false_negatives,
+    ) = counts
 
     # Calculate derived metrics
     total = (
@@ -151,6 +142,74 @@ def _compute_filter_metrics(
     return metrics
 
 
+def _count_filter_outcomes(
+    filter_name: str,
+    results: list[ToolParamsEvalResult],
+) -> tuple[int, int, int, int]:
+    """Tally (TP, TN, FP, FN) for one filter, skipping errored results."""
+    true_positives = true_negatives = false_positives = false_negatives = 0
+
+    for result in results:
+        if result.error:
+            continue  # Skip errored cases
+
+        # Get expected and actual values
+        expected = getattr(result.expected_filters, filter_name, None)
+        actual = result.actual_filters.get(filter_name)
+
+        expected_applied = expected is not None
+        actual_applied = actual is not None
+
+        if expected_applied and actual_applied:
+            # Check if the match was correct
+            if result.filter_matches.get(filter_name, False):
+                true_positives += 1
+            else:
+                # Applied but wrong value - count as FP for value accuracy
+                false_positives += 1
+        elif not expected_applied and not actual_applied:
+            true_negatives += 1
+        elif expected_applied and not actual_applied:
+            false_negatives += 1
+        else:  # not expected_applied and actual_applied
+            false_positives += 1
+
+    return true_positives, true_negatives, false_positives, false_negatives
+
+
+def _count_filter_outcomes_vectorized(
+    filter_name: str,
+    results: list[ToolParamsEvalResult],
+) -> tuple[int, int, int, int]:
+    """Vectorized `_count_filter_outcomes` for large result sets."""
+    count = len(results)
+    valid = np.fromiter((not r.error for r in results), dtype=bool, count=count)
+    expected = np.fromiter(
+        (getattr(r.expected_filters, filter_name, None) is not None for r in results),
+        dtype=bool,
+        count=count,
+    )
+    actual = np.fromiter(
+        (r.actual_filters.get(filter_name) is not None for r in results),
+        dtype=bool,
+        count=count,
+    )
+    matched = np.fromiter(
+        (r.filter_matches.get(filter_name, False) for r in results), dtype=bool, count=count
+    )
+
+    expected &= valid
+    actual &= valid
+    both = expected & actual
+    true_positives = int(np.count_nonzero(both & matched))
+    # Applied but wrong value also counts as FP for value accuracy
+    false_positives = int(np.count_nonzero(both & ~matched) + np.count_nonzero(actual & ~expected))
+    false_negatives = int(np.count_nonzero(expected & ~actual))
+    true_negatives = int(np.count_nonzero(valid & ~expected & ~actual))
+
+    return true_positives, true_negatives, false_positives, false_negatives
+
+
 def _compute_category_metrics(
     category: str,
     results: list[ToolParamsEvalResult],
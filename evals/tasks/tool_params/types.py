@@ -26,7 +26,7 @@ class ToolCallCapture:
     raw_args: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolParamsEvalResult:
     """Result of running a single tool parameter evaluation case.
 
@@ -1,7 +1,13 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
-from src.api.schemas import IngestResponse, TextIngestRequest
-from src.ingestion.pipeline import IngestionPipeline
+from src.api.schemas import (
+    IngestBatchResponse,
+    IngestResponse,
+    TextIngestBatchRequest,
+    TextIngestRequest,
+)
+from src.ingestion.pipeline import get_ingestion_pipeline
 
 router = APIRouter(prefix="/ingest", tags=["Ingestion"])
 
@@ -30,9 +36,13 @@ async def ingest_text(request: TextIngestRequest):
     embedding generation status, and processing time in milliseconds.
     """
     try:
-        pipeline = IngestionPipeline()
-        result = pipeline.ingest_raw_text(
-            text=request.text, title=request.title, metadata=request.metadata
+        pipeline = get_ingestion_pipeline()
+        # Ingestion is blocking (tokenizer, OpenAI, psycopg); keep it off the event loop
+        result = await run_in_threadpool(
+            pipeline.ingest_raw_text,
+            text=request.text,
+            title=request.title,
+            metadata=request.metadata,
         )
         return IngestResponse(**result)
 
@@ -43,3 +53,34 @@ async def ingest_text(request: TextIngestRequest):
     except Exception as e:
         # Unexpected errors
         raise HTTPException(status_code=500, detail=f"Ingestion failed: {str(e)}")
+
+
+@router.post("/text/batch", response_model=IngestBatchResponse)
+async def ingest_text_batch(request: TextIngestBatchRequest):
+    """Ingest multiple raw text documents in a single request
+
+    Same processing as `POST /ingest/text`, but all documents share one
+    database connection and transaction, rows are written with batched
+    inserts, and embeddings for every chunk are generated in one API call.
+
+    **Required:** `documents` - list of text ingestion payloads (minimum 1)
+
+    **Returns:** Per-document results in request order, plus total processing
+    time for the batch in milliseconds. Per-document times are the batch time
+    split evenly across the documents.
+    """
+    try:
+        pipeline = get_ingestion_pipeline()
+        result = await run_in_threadpool(
+            pipeline.ingest_raw_text_batch,
+            [doc.model_dump() for doc in request.documents],
+        )
+        return IngestBatchResponse(**result)
+
+    except ValueError as e:
+        # Invalid input
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except Exception as e:
+        # Unexpected errors
+        raise HTTPException(status_code=500, detail=f"Ingestion failed: {str(e)}")
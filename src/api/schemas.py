@@ -77,6 +77,43 @@ class IngestResponse(BaseModel):
     )
 
 
+class TextIngestBatchRequest(BaseModel):
+    """Request body for POST /ingest/text/batch
+
+    Ingest several raw text documents in one request. Documents are chunked
+    and written over a single database connection and transaction.
+    """
+
+    documents: list[TextIngestRequest] = Field(
+        ...,
+        description="Documents to ingest (required, minimum 1 document)",
+        min_length=1,
+    )
+
+
+class IngestBatchResponse(BaseModel):
+    """Response for POST /ingest/text/batch
+
+    Returns per-document ingestion results in request order.
+    """
+
+    results: list[IngestResponse] = Field(
+        ...,
+        description=(
+            "Ingestion result for each document, in the same order as the request. "
+            "Each result's ingestion_time_ms is the batch time split evenly across documents"
+        )
+    )
+    total_documents: int = Field(
+        ...,
+        description="Number of documents ingested"
+    )
+    ingestion_time_ms: float = Field(
+        ...,
+        description="Time taken to process the whole batch in milliseconds"
+    )
+
+
 # ============================================
 # Query Schemas
 # ============================================
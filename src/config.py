@@ -21,6 +21,9 @@ class Settings(BaseSettings):
     chunk_min_tokens: int = 400
     chunk_max_tokens: int = 800
     chunk_overlap_tokens: int = 50
+    # Texts whose chunks each chunker memoizes; 0 disables the cache so a
+    # long-running API doesn't hold ingested documents in memory
+    chunk_cache_size: int = 0
 
     # Retrieval
     default_retrieval_n: int = 50
@@ -1,11 +1,12 @@
 from dataclasses import dataclass
+from functools import lru_cache
 
 import tiktoken
 
 from src.config import settings
 
 
-@dataclass
+@dataclass(frozen=True)
 class Chunk:
     text: str
     token_count: int
@@ -24,11 +25,16 @@ class TokenBasedChunker:
         max_tokens: int = settings.chunk_max_tokens,
         overlap_tokens: int = settings.chunk_overlap_tokens,
         encoding_name: str = "cl100k_base",  # GPT-4 encoding
+        cache_size: int = settings.chunk_cache_size,
     ):
         self.min_tokens = min_tokens
         self.max_tokens = max_tokens
         self.overlap_tokens = overlap_tokens
+        self.encoding_name = encoding_name
         self.encoding = tiktoken.get_encoding(encoding_name)
+        # Opt-in memo of the last `cache_size` texts (CHUNK_CACHE_SIZE); off
+        # by default so a long-lived chunker doesn't hold ingested documents
+        self._chunk_text = lru_cache(maxsize=cache_size)(_chunk_text) if cache_size else _chunk_text
 
     def chunk(self, text: str) -> list[Chunk]:
         """
@@ -40,51 +46,76 @@ class TokenBasedChunker:
         3. Add overlap_tokens from previous chunk (if not first chunk)
         4. Decode tokens back to text
 
+        With a non-zero cache_size, results are memoized per text, so
+        chunking the same text again skips tokenization entirely.
+
         Args:
             text: Full document text
 
         Returns:
             List of Chunk objects with text, token count, and order
         """
-        # Encode full text to tokens
-        tokens = self.encoding.encode(text)
-
-        if len(tokens) == 0:
-            return []
-
-        chunks = []
-        start_idx = 0
-        chunk_ord = 0
-
-        while start_idx < len(tokens):
-            # Determine end index for this chunk
-            end_idx = min(start_idx + self.max_tokens, len(tokens))
-
-            # Extract chunk tokens
-            chunk_tokens = tokens[start_idx:end_idx]
-
-            # Decode back to text
-            chunk_text = self.encoding.decode(chunk_tokens)
-
-            # Skip if chunk is too small (except for last chunk)
-            if len(chunk_tokens) >= self.min_tokens or end_idx == len(tokens):
-                chunks.append(
-                    Chunk(
-                        text=chunk_text.strip(),
-                        token_count=len(chunk_tokens),
-                        ord=chunk_ord,
-                    )
-                )
-                chunk_ord += 1
-
-            # Move start index, accounting for overlap
-            if end_idx == len(tokens):
-                break
-
-            start_idx = end_idx - self.overlap_tokens
-
-        return chunks
+        return list(
+            self._chunk_text(
+                text,
+                self.min_tokens,
+                self.max_tokens,
+                self.overlap_tokens,
+                self.encoding_name,
+            )
+        )
 
     def count_tokens(self, text: str) -> int:
         """Count the number of tokens in text."""
         return len(self.encoding.encode(text))
+
+
+def _chunk_text(
+    text: str,
+    min_tokens: int,
+    max_tokens: int,
+    overlap_tokens: int,
+    encoding_name: str,
+) -> tuple[Chunk, ...]:
+    """Tokenize and chunk text; safe to memoize because Chunk is immutable."""
+    # tiktoken caches encodings by name, so this is a dict lookup
+    encoding = tiktoken.get_encoding(encoding_name)
+
+    # Encode full text to tokens
+    tokens = encoding.encode(text)
+
+    if len(tokens) == 0:
+        return ()
+
+    chunks = []
+    start_idx = 0
+    chunk_ord = 0
+
+    while start_idx < len(tokens):
+        # Determine end index for this chunk
+        end_idx = min(start_idx + max_tokens, len(tokens))
+
+        # Extract chunk tokens
+        chunk_tokens = tokens[start_idx:end_idx]
+
+        # Decode back to text
+        chunk_text = encoding.decode(chunk_tokens)
+
+        # Skip if chunk is too small (except for last chunk)
+        if len(chunk_tokens) >= min_tokens or end_idx == len(tokens):
+            chunks.append(
+                Chunk(
+                    text=chunk_text.strip(),
+                    token_count=len(chunk_tokens),
+                    ord=chunk_ord,
+                )
+            )
+            chunk_ord += 1
+
+        # Move start index, accounting for overlap
+        if end_idx == len(tokens):
+            break
+
+        start_idx = end_idx - overlap_tokens
+
+    return tuple(chunks)
@@ -1,10 +1,50 @@
 import json
 from datetime import datetime
+from functools import lru_cache
 
 from src.database.connection import execute_insert, get_db_connection
 from src.embeddings.service import EmbeddingService
 from src.ingestion.chunker import TokenBasedChunker
 
+INSERT_DOC_SQL = """
+    INSERT INTO docs (source, url, title, doc_type, published_at, raw_text, metadata)
+    VALUES (%(source)s, %(url)s, %(title)s, %(doc_type)s, %(published_at)s, %(raw_text)s, %(metadata)s)
+    RETURNING id
+"""
+
+INSERT_CHUNK_SQL = """
+    INSERT INTO chunks (doc_id, ord, text, token_count)
+    VALUES (%(doc_id)s, %(ord)s, %(text)s, %(token_count)s)
+    RETURNING id
+"""
+
+# Chunk row and its embedding written by one statement, so they commit together
+INSERT_CHUNK_WITH_EMBEDDING_SQL = """
+    WITH new_chunk AS (
+        INSERT INTO chunks (doc_id, ord, text, token_count)
+        VALUES (%(doc_id)s, %(ord)s, %(text)s, %(token_count)s)
+        RETURNING id
+    )
+    INSERT INTO chunk_embeddings (chunk_id, embedding)
+    SELECT id, %(embedding)s FROM new_chunk
+    RETURNING chunk_id AS id
+"""
+
+
+def _raw_document_params(
+    text: str, title: str | None, metadata: dict | None, published_at: datetime
+) -> dict:
+    """Build the INSERT_DOC_SQL parameters for a raw text document."""
+    return {
+        "source": "text",
+        "url": "n/a",
+        "title": title or "Untitled Document",
+        "doc_type": "text",
+        "published_at": published_at,
+        "raw_text": text,
+        "metadata": json.dumps(metadata or {}),
+    }
+
 
 class IngestionPipeline:
     """End-to-end ingestion pipeline: chunk → embed → store."""
@@ -29,10 +69,10 @@ class IngestionPipeline:
         Ingest raw text directly.
 
         Steps:
-        1. Create document entry
-        2. Chunk text
-        3. Insert chunks
-        4. Generate and insert embeddings
+        1. Chunk text
+        2. Generate embeddings (if enabled)
+        3. Create document entry
+        4. Insert chunks, together with their embeddings when generated
 
         Args:
             text: Raw text to ingest
@@ -44,23 +84,26 @@ class IngestionPipeline:
         """
         start_time = datetime.now()
 
-        # Step 1: Insert document
+        # Step 1: Chunk text
+        chunks = self.chunker.chunk(text)
+
+        # Step 2: Generate embeddings up front so chunks land with their vectors
+        embeddings: list[list[float]] | None = None
+        if self.generate_embeddings and self.embedding_service and chunks:
+            print("\nGenerating embeddings...")
+            embeddings = self.embedding_service.embed_batch([c.text for c in chunks])
+
+        # Step 3: Insert document
         doc_id = self._insert_raw_document(text, title, metadata)
         if doc_id is None:
             raise ValueError("Failed to insert document into database")
 
-        # Step 2: Chunk text
-        chunks = self.chunker.chunk(text)
-
-        # Step 3: Insert chunks
-        chunk_ids = self._insert_chunks(doc_id, chunks)
-
-        # Step 4: Generate and insert embeddings (if enabled)
-        embeddings_generated = False
-        if self.generate_embeddings and self.embedding_service:
-            print("\nGenerating embeddings...")
-            self._generate_and_insert_embeddings(chunk_ids, chunks)
-            embeddings_generated = True
+        # Step 4: Insert chunks (and embeddings, in the same statement)
+        if embeddings is not None:
+            self._insert_chunks_with_embeddings(doc_id, chunks, embeddings)
+        else:
+            self._insert_chunks(doc_id, chunks)
+        embeddings_generated = embeddings is not None
 
         end_time = datetime.now()
         elapsed_ms = (end_time - start_time).total_seconds() * 1000
@@ -75,46 +118,116 @@ class IngestionPipeline:
             "embeddings_generated": embeddings_generated,
         }
 
-    def _insert_raw_document(
-        self, text: str, title: str | None, metadata: dict | None
-    ) -> int | None:
-        """Insert raw text document into docs table."""
-        query = """
-            INSERT INTO docs (source, url, title, doc_type, published_at, raw_text, metadata)
-            VALUES (%(source)s, %(url)s, %(title)s, %(doc_type)s, %(published_at)s, %(raw_text)s, %(metadata)s)
-            RETURNING id
+    def ingest_raw_text_batch(self, documents: list[dict]) -> dict:
         """
+        Ingest several raw text documents over a single connection.
 
-        params = {
-            "source": "text",
-            "url": "n/a",
-            "title": title or "Untitled Document",
-            "doc_type": "text",
-            "published_at": datetime.now(),
-            "raw_text": text,
-            "metadata": json.dumps(metadata or {}),
+        Embeddings for all chunks are generated in one batched API call, then
+        documents and chunks (with their embeddings) are written with one
+        `executemany` each.
+
+        Args:
+            documents: List of dicts with keys:
+                - text: str
+                - title: str | None
+                - metadata: dict | None
+
+        Returns:
+            Dict with per-document results, document count, and timing info.
+            Documents share one pass, so each result's `ingestion_time_ms` is
+            the batch time divided evenly across the documents.
+        """
+        start_time = datetime.now()
+
+        # Step 1: Chunk every document up front
+        doc_chunks = [self.chunker.chunk(doc["text"]) for doc in documents]
+        all_chunks = [chunk for chunks in doc_chunks for chunk in chunks]
+
+        # Step 2: Generate embeddings for every chunk (if enabled)
+        embeddings: list[list[float]] | None = None
+        if self.generate_embeddings and self.embedding_service and all_chunks:
+            print("\nGenerating embeddings...")
+            embeddings = self.embedding_service.embed_batch([c.text for c in all_chunks])
+
+        published_at = datetime.now()
+        doc_rows = [
+            _raw_document_params(doc["text"], doc.get("title"), doc.get("metadata"), published_at)
+            for doc in documents
+        ]
+
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                # Step 3: Insert documents
+                cur.executemany(INSERT_DOC_SQL, doc_rows, returning=True)  # type: ignore[arg-type]
+                doc_ids = _collect_returned_ids(cur)
+                if len(doc_ids) != len(documents):
+                    raise ValueError("Failed to insert documents into database")
+
+                # Step 4: Insert chunks (and embeddings) for all documents
+                chunk_rows = [
+                    {
+                        "doc_id": doc_id,
+                        "ord": chunk.ord,
+                        "text": chunk.text,
+                        "token_count": chunk.token_count,
+                    }
+                    for doc_id, chunks in zip(doc_ids, doc_chunks)
+                    for chunk in chunks
+                ]
+                if embeddings is not None:
+                    for row, embedding in zip(chunk_rows, embeddings):
+                        row["embedding"] = embedding
+                    cur.executemany(INSERT_CHUNK_WITH_EMBEDDING_SQL, chunk_rows)  # type: ignore[arg-type]
+                elif chunk_rows:
+                    cur.executemany(INSERT_CHUNK_SQL, chunk_rows)  # type: ignore[arg-type]
+                conn.commit()
+
+        if embeddings is not None:
+            print(f"✓ Generated and inserted {len(embeddings)} embeddings")
+        embeddings_generated = embeddings is not None
+
+        end_time = datetime.now()
+        elapsed_ms = round((end_time - start_time).total_seconds() * 1000, 2)
+        per_doc_ms = round(elapsed_ms / len(doc_ids), 2)
+
+        results = [
+            {
+                "doc_id": doc_id,
+                "url": "n/a",
+                "title": row["title"],
+                "chunk_count": len(chunks),
+                "total_tokens": sum(c.token_count for c in chunks),
+                "ingestion_time_ms": per_doc_ms,
+                "embeddings_generated": embeddings_generated and bool(chunks),
+            }
+            for doc_id, row, chunks in zip(doc_ids, doc_rows, doc_chunks)
+        ]
+
+        return {
+            "results": results,
+            "total_documents": len(results),
+            "ingestion_time_ms": elapsed_ms,
         }
 
-        return execute_insert(query, params)
+    def _insert_raw_document(
+        self, text: str, title: str | None, metadata: dict | None
+    ) -> int | None:
+        """Insert raw text document into docs table."""
+        params = _raw_document_params(text, title, metadata, datetime.now())
+        return execute_insert(INSERT_DOC_SQL, params)
 
     def _insert_chunks(self, doc_id: int, chunks: list) -> list[int]:
         """Batch insert chunks into chunks table and return chunk IDs."""
         if not chunks:
             return []
 
-        query = """
-            INSERT INTO chunks (doc_id, ord, text, token_count)
-            VALUES (%(doc_id)s, %(ord)s, %(text)s, %(token_count)s)
-            RETURNING id
-        """
-
         chunk_ids = []
         with get_db_connection() as conn:
             with conn.cursor() as cur:
                 # Batch insert for efficiency
                 for chunk in chunks:
                     cur.execute(
-                        query,  # type: ignore[arg-type]
+                        INSERT_CHUNK_SQL,  # type: ignore[arg-type]
                         {
                             "doc_id": doc_id,
                             "ord": chunk.ord,
@@ -129,6 +242,33 @@ class IngestionPipeline:
 
         return chunk_ids
 
+    def _insert_chunks_with_embeddings(
+        self, doc_id: int, chunks: list, embeddings: list[list[float]]
+    ) -> list[int]:
+        """Insert chunks and their embeddings in one batched statement and return chunk IDs."""
+        if not chunks:
+            return []
+
+        rows = [
+            {
+                "doc_id": doc_id,
+                "ord": chunk.ord,
+                "text": chunk.text,
+                "token_count": chunk.token_count,
+                "embedding": embedding,
+            }
+            for chunk, embedding in zip(chunks, embeddings)
+        ]
+
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.executemany(INSERT_CHUNK_WITH_EMBEDDING_SQL, rows, returning=True)  # type: ignore[arg-type]
+                chunk_ids = _collect_returned_ids(cur)
+                conn.commit()
+
+        print(f"✓ Generated and inserted {len(embeddings)} embeddings")
+        return chunk_ids
+
     def _generate_and_insert_embeddings(
         self, chunk_ids: list[int], chunks: list
     ) -> None:
@@ -150,8 +290,13 @@ class IngestionPipeline:
 
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                for chunk_id, embedding in zip(chunk_ids, embeddings):
-                    cur.execute(query, {"chunk_id": chunk_id, "embedding": embedding})
+                cur.executemany(
+                    query,
+                    [
+                        {"chunk_id": chunk_id, "embedding": embedding}
+                        for chunk_id, embedding in zip(chunk_ids, embeddings)
+                    ],
+                )
                 conn.commit()
 
         print(f"✓ Generated and inserted {len(embeddings)} embeddings")
@@ -263,11 +408,6 @@ class IngestionPipeline:
         doc_type: str = "transcript",
     ) -> int | None:
         """Insert podcast document into docs table."""
-        query = """
-            INSERT INTO docs (source, url, title, doc_type, published_at, raw_text, metadata)
-            VALUES (%(source)s, %(url)s, %(title)s, %(doc_type)s, %(published_at)s, %(raw_text)s, %(metadata)s)
-            RETURNING id
-        """
 
         params = {
             "source": "dwarkesh",
@@ -279,7 +419,7 @@ class IngestionPipeline:
             "metadata": json.dumps(metadata or {}),
         }
 
-        return execute_insert(query, params)
+        return execute_insert(INSERT_DOC_SQL, params)
 
     def _insert_turns(self, doc_id: int, turns: list[dict]) -> list[int]:
         """Batch insert turns into turns table and return turn IDs."""
@@ -344,3 +484,36 @@ class IngestionPipeline:
                 "token_count": token_count,
             },
         )
+
+
+def _collect_returned_ids(cur) -> list[int]:
+    """Collect the `id` column from each result set of an `executemany(..., returning=True)`."""
+    ids = []
+    while True:
+        row = cur.fetchone()
+        if row:
+            ids.append(row["id"])
+        if not cur.nextset():
+            break
+    return ids
+
+
+@lru_cache(maxsize=1)
+def _shared_ingestion_pipeline() -> IngestionPipeline:
+    """Build the pipeline shared by get_ingestion_pipeline()."""
+    return IngestionPipeline()
+
+
+def get_ingestion_pipeline() -> IngestionPipeline:
+    """
+    Return the process-wide ingestion pipeline.
+
+    The chunker's tokenizer and the embedding client are built once and reused
+    across requests instead of on every ingest call. A pipeline whose embedding
+    service failed to initialise is not kept, so the next call retries.
+    """
+    pipeline = _shared_ingestion_pipeline()
+    if not pipeline.generate_embeddings:
+        # e.g. the API key wasn't set yet; don't pin an embedding-less pipeline
+        _shared_ingestion_pipeline.cache_clear()
+    return pipeline
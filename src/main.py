@@ -63,6 +63,7 @@ async def root():
             "POST /api/chat/completion",
             "POST /api/ingest/youtube",
             "POST /api/ingest/text",
+            "POST /api/ingest/text/batch",
             "POST /api/retrieval/query",
             "GET /api/retrieval/bench",
             "GET /api/health",
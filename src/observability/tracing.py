@@ -18,28 +18,37 @@ Simply use:
 """
 
 import os
-from typing import Any, Dict
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
 
 
-def get_langsmith_config() -> Dict[str, Any]:
+@lru_cache(maxsize=1)
+def get_langsmith_config() -> Mapping[str, Any]:
     """Get LangSmith configuration from environment variables.
 
+    The result is cached for the life of the process; call
+    ``get_langsmith_config.cache_clear()`` after changing the environment.
+    It is shared by every caller, so it is returned read-only.
+
     Returns:
-        Dict with LangSmith configuration
+        Read-only mapping with LangSmith configuration
 
     Raises:
         ValueError: If required environment variables are missing
     """
-    api_key = os.getenv("LANGSMITH_API_KEY")
+    env = os.environ
+    api_key = env.get("LANGSMITH_API_KEY")
     if not api_key:
         raise ValueError(
             "LANGSMITH_API_KEY not found in environment. "
             "Please set it in .env file or environment variables."
         )
 
-    return {
+    return MappingProxyType({
         "api_key": api_key,
-        "project": os.getenv("LANGSMITH_PROJECT", "retrieval-evals"),
-        "endpoint": os.getenv("LANGSMITH_ENDPOINT", "https://api.smith.langchain.com"),
-        "tracing_enabled": os.getenv("LANGSMITH_TRACING", "true").lower() == "true",
-    }
+        "project": env.get("LANGSMITH_PROJECT", "retrieval-evals"),
+        "endpoint": env.get("LANGSMITH_ENDPOINT", "https://api.smith.langchain.com"),
+        "tracing_enabled": env.get("LANGSMITH_TRACING", "true").lower() == "true",
+    })
@@ -3,6 +3,18 @@
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+# Zero-padded two-digit strings so HH:MM:SS formatting is three lookups, not an f-string
+_TT = tuple(f"{i:02d}" for i in range(100))
+
+
+def _format_hms(total_seconds: int) -> str:
+    """Format a second offset as HH:MM:SS."""
+    hours, remainder = total_seconds // 3600, total_seconds % 3600
+    minutes, seconds = remainder // 60, remainder % 60
+    if 0 <= hours < 100:
+        return _TT[hours] + ":" + _TT[minutes] + ":" + _TT[seconds]
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
 
 class ParsedTurn(BaseModel):
     """Single speaker turn from transcript."""
@@ -18,9 +30,7 @@ class ParsedTurn(BaseModel):
         """Format timestamp as HH:MM:SS for display."""
         if self.start_time_seconds is None:
             return ""
-        hours, remainder = divmod(self.start_time_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        return _format_hms(self.start_time_seconds)
 
 
 class ParsedSection(BaseModel):
@@ -32,9 +42,7 @@ class ParsedSection(BaseModel):
     @property
     def timestamp_display(self) -> str:
         """Format timestamp as HH:MM:SS for display."""
-        hours, remainder = divmod(self.timestamp_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        return _format_hms(self.timestamp_seconds)
 
 
 class Episode(BaseModel):
@@ -6,35 +6,108 @@ Handles the markdown-style transcript format:
 """
 
 import re
+import sys
+from types import ModuleType
+from typing import TypedDict
+
+import numpy as np
 from bs4 import BeautifulSoup
 
 from src.scrapers.dwarkesh.models import Episode, EpisodeMetadata, ParsedSection, ParsedTurn
 
+try:
+    # Optional linear-time DFA matcher (pip install google-re2); the patterns
+    # below avoid backreferences and lookarounds so both engines accept them.
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
+
 
-# Regex patterns for transcript parsing
+# Regex sources for transcript parsing, shared by the `re` and `re2` backends
 # Speaker with timestamp: **Name** _HH:MM:SS_ or **Name** _H:MM:SS_
-SPEAKER_PATTERN = re.compile(
+SPEAKER_REGEX = (
     r"\*\*(?P<speaker>[^*]+)\*\*\s*_(?P<hours>\d{1,2}):(?P<minutes>\d{2}):(?P<seconds>\d{2})_"
 )
 
 # Section header: [(HH:MM:SS) – Topic Title] or [(HH:MM:SS) - Topic Title]
 # Note: Uses en-dash (–) or hyphen (-)
-SECTION_PATTERN = re.compile(
+SECTION_REGEX = (
     r"\[\((?P<hours>\d{1,2}):(?P<minutes>\d{2}):(?P<seconds>\d{2})\)\s*[–\-]\s*(?P<title>[^\]]+)\]"
 )
 
 # Alternative markdown heading section: ### (HH:MM:SS) – Topic
-SECTION_HEADING_PATTERN = re.compile(
-    r"^###?\s*\(?(?P<hours>\d{1,2}):(?P<minutes>\d{2}):(?P<seconds>\d{2})\)?\s*[–\-]\s*(?P<title>.+)$",
-    re.MULTILINE,
+# Multiline is set inline because re2 has no MULTILINE flag constant.
+SECTION_HEADING_REGEX = (
+    r"(?m)^###?\s*\(?(?P<hours>\d{1,2}):(?P<minutes>\d{2}):(?P<seconds>\d{2})\)?\s*[–\-]\s*(?P<title>.+)$"
 )
 
+# Runs of whitespace collapsed to a single space in turn text
+WHITESPACE_REGEX = r"\s+"
+
+
+def _prefix_groups(source: str, prefix: str) -> str:
+    """Prefix every named group in a pattern source so alternatives can be combined."""
+    return source.replace("(?P<", f"(?P<{prefix}_")
+
+
+# Single alternation over speaker markers, bracket sections and heading sections,
+# dispatched on the outer block group so a transcript is scanned exactly once.
+_BLOCK_GROUP_PREFIX = {"speaker_block": "sp", "section_block": "sec", "heading_block": "hd"}
+COMBINED_REGEX = (
+    "(?m)"
+    f"(?P<speaker_block>{_prefix_groups(SPEAKER_REGEX, 'sp')})"
+    f"|(?P<section_block>{_prefix_groups(SECTION_REGEX, 'sec')})"
+    f"|(?P<heading_block>{_prefix_groups(SECTION_HEADING_REGEX.removeprefix('(?m)'), 'hd')})"
+)
+
+
+class CompiledPatterns(TypedDict):
+    """Compiled transcript patterns, keyed by their module-level names.
+
+    re2 patterns are typed as `re.Pattern` since they share its interface.
+    """
+
+    SPEAKER_PATTERN: re.Pattern[str]
+    SECTION_PATTERN: re.Pattern[str]
+    SECTION_HEADING_PATTERN: re.Pattern[str]
+    COMBINED_PATTERN: re.Pattern[str]
+    WHITESPACE_PATTERN: re.Pattern[str]
+
+
+def compile_patterns(engine: ModuleType = regex_engine) -> CompiledPatterns:
+    """Compile the transcript patterns with the given regex module (`re` or `re2`)."""
+    return {
+        "SPEAKER_PATTERN": engine.compile(SPEAKER_REGEX),
+        "SECTION_PATTERN": engine.compile(SECTION_REGEX),
+        "SECTION_HEADING_PATTERN": engine.compile(SECTION_HEADING_REGEX),
+        "COMBINED_PATTERN": engine.compile(COMBINED_REGEX),
+        # re2's \s is ASCII-only; keep stdlib `re` so non-breaking spaces still collapse
+        "WHITESPACE_PATTERN": re.compile(WHITESPACE_REGEX),
+    }
+
+
+_patterns = compile_patterns()
+SPEAKER_PATTERN = _patterns["SPEAKER_PATTERN"]
+SECTION_PATTERN = _patterns["SECTION_PATTERN"]
+SECTION_HEADING_PATTERN = _patterns["SECTION_HEADING_PATTERN"]
+COMBINED_PATTERN = _patterns["COMBINED_PATTERN"]
+WHITESPACE_PATTERN = _patterns["WHITESPACE_PATTERN"]
+
 
 def parse_timestamp_to_seconds(hours: str, minutes: str, seconds: str) -> int:
     """Convert HH:MM:SS components to total seconds."""
     return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
 
 
+def parse_timestamps_bulk(hours: list[str], minutes: list[str], seconds: list[str]) -> np.ndarray:
+    """Convert parallel lists of HH:MM:SS components to an int64 array of total seconds."""
+    return (
+        np.asarray(hours, dtype=np.int64) * 3600
+        + np.asarray(minutes, dtype=np.int64) * 60
+        + np.asarray(seconds, dtype=np.int64)
+    )
+
+
 class DwarkeshParser:
     """Parse Dwarkesh Podcast transcript content."""
 
@@ -48,74 +121,90 @@ class DwarkeshParser:
         Returns:
             Tuple of (turns, sections)
         """
-        sections = self._extract_sections(content)
-        turns = self._extract_turns(content, sections)
-        return turns, sections
+        # Timestamp components for every match, converted in one vectorized call below
+        hours: list[str] = []
+        minutes: list[str] = []
+        seconds: list[str] = []
+        # (block, speaker or title, text_parts) for each match in document order
+        entries: list[tuple[str, str, list[str] | None]] = []
+
+        # Single scan: text between matches belongs to the current speaker's turn,
+        # so inline section headers are dropped without a second pass over the body.
+        text_parts: list[str] | None = None
+        prev_end = 0
+        for match in COMBINED_PATTERN.finditer(content):
+            if text_parts is not None:
+                text_parts.append(content[prev_end : match.start()])
+            prev_end = match.end()
+
+            block = match.lastgroup
+            prefix = _BLOCK_GROUP_PREFIX[block]
+            hours.append(match.group(f"{prefix}_hours"))
+            minutes.append(match.group(f"{prefix}_minutes"))
+            seconds.append(match.group(f"{prefix}_seconds"))
+            if block == "speaker_block":
+                text_parts = []
+                # Interned so repeated speakers share one string across all turns
+                speaker = sys.intern(match.group("sp_speaker").strip())
+                entries.append((block, speaker, text_parts))
+            else:
+                entries.append((block, match.group(f"{prefix}_title").strip(), None))
+
+        if text_parts is not None:
+            text_parts.append(content[prev_end:])
+
+        timestamps = parse_timestamps_bulk(hours, minutes, seconds).tolist()
+
+        bracket_sections: list[ParsedSection] = []
+        heading_sections: list[ParsedSection] = []
+        # (speaker, timestamp_seconds, text_parts) for each speaker marker in order
+        markers: list[tuple[str, int, list[str]]] = []
+        for (block, label, parts), timestamp_seconds in zip(entries, timestamps):
+            if block == "speaker_block":
+                markers.append((label, timestamp_seconds, parts))
+            elif block == "section_block":
+                bracket_sections.append(
+                    ParsedSection(title=label, timestamp_seconds=timestamp_seconds)
+                )
+            else:
+                heading_sections.append(
+                    ParsedSection(title=label, timestamp_seconds=timestamp_seconds)
+                )
 
-    def _extract_sections(self, content: str) -> list[ParsedSection]:
-        """Extract section headers with timestamps."""
-        sections = []
+        sections = self._merge_sections(bracket_sections, heading_sections)
+        turns = self._build_turns(markers, sections)
+        return turns, sections
 
-        # Try bracket format first: [(HH:MM:SS) – Topic]
-        for match in SECTION_PATTERN.finditer(content):
-            timestamp_seconds = parse_timestamp_to_seconds(
-                match.group("hours"), match.group("minutes"), match.group("seconds")
-            )
-            sections.append(
-                ParsedSection(
-                    title=match.group("title").strip(),
-                    timestamp_seconds=timestamp_seconds,
-                )
-            )
+    def _merge_sections(
+        self, bracket_sections: list[ParsedSection], heading_sections: list[ParsedSection]
+    ) -> list[ParsedSection]:
+        """Combine bracket and heading sections, preferring brackets on timestamp clashes."""
+        sections = list(bracket_sections)
 
-        # Also try heading format: ### (HH:MM:SS) – Topic
-        for match in SECTION_HEADING_PATTERN.finditer(content):
-            timestamp_seconds = parse_timestamp_to_seconds(
-                match.group("hours"), match.group("minutes"), match.group("seconds")
-            )
-            # Avoid duplicates
-            if not any(s.timestamp_seconds == timestamp_seconds for s in sections):
-                sections.append(
-                    ParsedSection(
-                        title=match.group("title").strip(),
-                        timestamp_seconds=timestamp_seconds,
-                    )
-                )
+        # Heading format only adds sections at timestamps not already seen
+        seen_timestamps = {s.timestamp_seconds for s in sections}
+        for section in heading_sections:
+            if section.timestamp_seconds not in seen_timestamps:
+                seen_timestamps.add(section.timestamp_seconds)
+                sections.append(section)
 
         # Sort by timestamp
         sections.sort(key=lambda s: s.timestamp_seconds)
         return sections
 
-    def _extract_turns(
-        self, content: str, sections: list[ParsedSection]
+    def _build_turns(
+        self, markers: list[tuple[str, int, list[str]]], sections: list[ParsedSection]
     ) -> list[ParsedTurn]:
         """
-        Extract speaker turns from transcript content.
+        Build speaker turns from scanned markers.
 
-        Each turn is identified by **Speaker** _HH:MM:SS_ pattern.
-        Text following the pattern until the next speaker is the turn content.
+        Each turn's text is everything between its **Speaker** _HH:MM:SS_ marker
+        and the next speaker marker, minus any section headers in between.
         """
         turns = []
 
-        # Find all speaker markers with their positions
-        markers = list(SPEAKER_PATTERN.finditer(content))
-
-        if not markers:
-            return turns
-
-        for i, match in enumerate(markers):
-            speaker = match.group("speaker").strip()
-            timestamp_seconds = parse_timestamp_to_seconds(
-                match.group("hours"), match.group("minutes"), match.group("seconds")
-            )
-
-            # Extract text from end of this marker to start of next marker (or end of content)
-            start_pos = match.end()
-            end_pos = markers[i + 1].start() if i + 1 < len(markers) else len(content)
-
-            # Get the raw text and clean it
-            raw_text = content[start_pos:end_pos].strip()
-            cleaned_text = self._clean_turn_text(raw_text)
+        for speaker, timestamp_seconds, text_parts in markers:
+            cleaned_text = self._clean_turn_text("".join(text_parts))
 
             # Skip empty turns
             if not cleaned_text:
@@ -137,16 +226,8 @@ class DwarkeshParser:
         return turns
 
     def _clean_turn_text(self, text: str) -> str:
-        """Clean turn text by removing section headers and extra whitespace."""
-        # Remove section headers
-        text = SECTION_PATTERN.sub("", text)
-        text = SECTION_HEADING_PATTERN.sub("", text)
-
-        # Normalize whitespace
-        text = re.sub(r"\s+", " ", text)
-        text = text.strip()
-
-        return text
+        """Clean turn text by collapsing extra whitespace."""
+        return WHITESPACE_PATTERN.sub(" ", text).strip()
 
     def _find_section_for_timestamp(
         self, timestamp_seconds: int, sections: list[ParsedSection]
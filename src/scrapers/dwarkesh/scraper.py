@@ -89,6 +89,7 @@ class DwarkeshScraper:
         """Parse archive page HTML to extract episode metadata."""
         soup = BeautifulSoup(html, "lxml")
         episodes = []
+        seen_slugs: set[str] = set()
 
         # Find all podcast episode links
         # Substack archive typically has links in article cards
@@ -101,8 +102,9 @@ class DwarkeshScraper:
                 url = f"{BASE_URL}/p/{slug}"
 
                 # Skip duplicates
-                if any(e.slug == slug for e in episodes):
+                if slug in seen_slugs:
                     continue
+                seen_slugs.add(slug)
 
                 # Try to get title from link text or parent
                 title = link.get_text().strip()
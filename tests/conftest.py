@@ -1,22 +1,53 @@
 """Pytest configuration and fixtures."""
 
+import os
+from pathlib import Path
+
+import psycopg
 import pytest
 from fastapi.testclient import TestClient
 
 from src.agents.helpers import flush_traces, initialize_tracing, shutdown_tracing
+from src.config import settings
 from src.database.connection import close_db_pool, get_db_connection, init_db_pool
 from src.main import app
 
+SCHEMA_SQL = Path(__file__).resolve().parent.parent / "src" / "database" / "schema.sql"
+
+
+def _worker_schema() -> str | None:
+    """Postgres schema for the current pytest-xdist worker, or None when not under xdist."""
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    return f"test_{worker_id}" if worker_id else None
+
 
 @pytest.fixture(scope="session")
 def db_pool():
-    """Initialize database connection pool for the test session."""
+    """Initialize database connection pool for the test session.
+
+    Under pytest-xdist each worker gets its own schema, created from
+    schema.sql and put first on the search_path of every connection (via
+    PGOPTIONS, so the app's pool picks it up too). Workers can then truncate
+    and insert without interfering with each other.
+    """
+    schema = _worker_schema()
+    if schema:
+        os.environ["PGOPTIONS"] = f"-c search_path={schema},public"
+        with psycopg.connect(settings.database_url, autocommit=True) as conn:
+            conn.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")  # type: ignore[arg-type]
+            conn.execute(f"CREATE SCHEMA {schema}")  # type: ignore[arg-type]
+            conn.execute(SCHEMA_SQL.read_text())  # type: ignore[arg-type]
+
     init_db_pool()
     initialize_tracing()
     yield
     shutdown_tracing()
     close_db_pool()
 
+    if schema:
+        with psycopg.connect(settings.database_url, autocommit=True) as conn:
+            conn.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")  # type: ignore[arg-type]
+
 
 @pytest.fixture(scope="function", autouse=True)
 def flush_traces_after_test():
@@ -32,26 +63,40 @@ def db_connection(db_pool):
         yield conn
 
 
-@pytest.fixture(scope="function")
-def clean_db(db_connection):
-    """Clean database before and after each test."""
-    # Clean before test
-    with db_connection.cursor() as cur:
-        cur.execute("TRUNCATE chunk_embeddings CASCADE")
-        cur.execute("TRUNCATE chunks CASCADE")
-        cur.execute("TRUNCATE turns CASCADE")
-        cur.execute("TRUNCATE docs CASCADE")
-        db_connection.commit()
-
-    yield db_connection
-
-    # Clean after test
-    with db_connection.cursor() as cur:
-        cur.execute("TRUNCATE chunk_embeddings CASCADE")
-        cur.execute("TRUNCATE chunks CASCADE")
-        cur.execute("TRUNCATE turns CASCADE")
-        cur.execute("TRUNCATE docs CASCADE")
-        db_connection.commit()
+TRUNCATE_ALL_SQL = "TRUNCATE chunk_embeddings, chunks, turns, docs RESTART IDENTITY CASCADE"
+
+
+def _truncate_all(conn) -> None:
+    """Empty every table in a single statement, discarding any aborted transaction first."""
+    conn.rollback()
+    with conn.cursor() as cur:
+        cur.execute(TRUNCATE_ALL_SQL)
+    conn.commit()
+
+
+@pytest.fixture(scope="module")
+def clean_db(db_pool):
+    """Database connection shared by a test module, with tables emptied at module start/end.
+
+    Per-test isolation is handled by `reset_clean_db`, which truncates after
+    every test that requests this fixture.
+    """
+    with get_db_connection() as conn:
+        _truncate_all(conn)
+        yield conn
+        _truncate_all(conn)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def reset_clean_db(request):
+    """Truncate tables after each test that uses `clean_db`."""
+    if "clean_db" not in request.fixturenames:
+        yield
+        return
+
+    conn = request.getfixturevalue("clean_db")
+    yield
+    _truncate_all(conn)
 
 
 @pytest.fixture(scope="module")
@@ -61,7 +106,7 @@ def test_client():
         yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_text():
     """Provide sample text for testing."""
     return """
@@ -76,7 +121,15 @@ def sample_text():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def long_transcript():
+    """Provide text long enough to span several chunks, built once per session."""
+    return " ".join(
+        ["Machine learning models learn patterns from data and improve with experience."] * 100
+    )
+
+
+@pytest.fixture(scope="session")
 def sample_short_text():
     """Provide short sample text for testing."""
     return "Machine learning is a cool technology that helps computers learn from data."
@@ -1,5 +1,6 @@
 """Integration tests for POST /api/retrieval/query-expanded endpoint."""
 
+import fastjsonschema
 import pytest
 
 from dotenv import load_dotenv
@@ -7,6 +8,71 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+QE_URL = "/api/retrieval/query-expanded"
+
+TURN_DATA_SCHEMA = {
+    "type": "object",
+    "required": ["turn_id", "doc_id", "ord", "speaker", "full_text", "token_count"],
+}
+
+RESPONSE_SCHEMA = {
+    "type": "object",
+    "required": [
+        "turns",
+        "total_turns",
+        "total_tokens",
+        "deduplication_stats",
+        "timing_ms",
+        "query_info",
+    ],
+    "properties": {
+        "turns": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": [
+                    "turn_id",
+                    "doc_id",
+                    "ord",
+                    "speaker",
+                    "full_text",
+                    "start_time_seconds",
+                    "section_title",
+                    "token_count",
+                    "relevance_score",
+                    "doc_metadata",
+                    "preceding_question",  # Should be None or TurnData
+                ],
+                "properties": {
+                    "doc_metadata": {
+                        "type": "object",
+                        "required": ["title", "url", "source"],
+                    },
+                    "preceding_question": {
+                        "anyOf": [{"type": "null"}, TURN_DATA_SCHEMA],
+                    },
+                },
+            },
+        },
+        "deduplication_stats": {
+            "type": "object",
+            "required": ["chunks_retrieved", "unique_turns", "chunks_deduplicated"],
+        },
+        "timing_ms": {
+            "type": "object",
+            "required": ["retrieval_ms", "expansion_ms", "total_ms"],
+        },
+    },
+}
+
+_LONG_QUERY = "AI safety " * 100
+
+REQUIRED_PQ_FIELDS = frozenset({"turn_id", "speaker", "full_text", "token_count"})
+
+# Compiled once at import; raises JsonSchemaValueException naming the failing path
+_validate = fastjsonschema.compile(RESPONSE_SCHEMA)
+
+
 @pytest.mark.integration
 class TestQueryExpandedEndpoint:
     """Test suite for POST /api/retrieval/query-expanded endpoint."""
@@ -15,7 +81,7 @@ class TestQueryExpandedEndpoint:
         """Test basic query expansion retrieves and expands chunks to turns."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "AI safety alignment",
                 "max_chunks": 10,
@@ -25,66 +91,28 @@ class TestQueryExpandedEndpoint:
 
         # Assert
         assert response.status_code == 200
-        data = response.json()
-
-        # Should have turns returned
-        assert "turns" in data
-        assert "total_turns" in data
-        assert "total_tokens" in data
-        assert "deduplication_stats" in data
-        assert "timing_ms" in data
-        assert "query_info" in data
-
-        # Verify timing breakdown
-        assert "retrieval_ms" in data["timing_ms"]
-        assert "expansion_ms" in data["timing_ms"]
-        assert "total_ms" in data["timing_ms"]
-
-        # Verify deduplication stats
-        assert "chunks_retrieved" in data["deduplication_stats"]
-        assert "unique_turns" in data["deduplication_stats"]
-        assert "chunks_deduplicated" in data["deduplication_stats"]
+        _validate(response.json())
 
     def test_query_expanded_returns_turn_fields(self, test_client, sample_podcast_with_turns):
         """Test that all expected turn fields are returned."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "AI safety",
                 "max_chunks": 10,
             }
         )
 
-        # Assert
+        # Assert - schema checks every turn, including doc_metadata fields
         assert response.status_code == 200
-        data = response.json()
-
-        if data["total_turns"] > 0:
-            turn = data["turns"][0]
-            # Check all required fields
-            assert "turn_id" in turn
-            assert "doc_id" in turn
-            assert "ord" in turn
-            assert "speaker" in turn
-            assert "full_text" in turn
-            assert "start_time_seconds" in turn
-            assert "section_title" in turn
-            assert "token_count" in turn
-            assert "relevance_score" in turn
-            assert "doc_metadata" in turn
-            assert "preceding_question" in turn  # Should be None or TurnData
-
-            # Check doc_metadata fields
-            assert "title" in turn["doc_metadata"]
-            assert "url" in turn["doc_metadata"]
-            assert "source" in turn["doc_metadata"]
+        _validate(response.json())
 
     def test_query_expanded_deduplication(self, test_client, sample_podcast_with_turns):
         """Test that multiple chunks from same turn are deduplicated."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "alignment technical research",  # Should match turn with 2 chunks
                 "max_chunks": 50,
@@ -109,7 +137,7 @@ class TestQueryExpandedEndpoint:
         """Test that deduplication preserves the highest relevance score."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "AI safety crucial alignment",
                 "max_chunks": 50,
@@ -129,7 +157,7 @@ class TestQueryExpandedEndpoint:
         """Test that token budget limits the number of returned turns."""
         # Act - use a small token budget (must be >= 100 per schema validation)
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "AI safety governance",
                 "max_chunks": 50,
@@ -148,7 +176,7 @@ class TestQueryExpandedEndpoint:
         """Test including preceding question in response."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "AI safety crucial",  # Should match guest's response
                 "max_chunks": 10,
@@ -161,16 +189,12 @@ class TestQueryExpandedEndpoint:
         assert response.status_code == 200
         data = response.json()
 
-        # Check if any turn has a preceding question
-        turns_with_questions = [t for t in data["turns"] if t["preceding_question"] is not None]
-
         # Turns that are not first in doc should have preceding questions
-        for turn in turns_with_questions:
+        for turn in data["turns"]:
             pq = turn["preceding_question"]
-            assert "turn_id" in pq
-            assert "speaker" in pq
-            assert "full_text" in pq
-            assert "token_count" in pq
+            if pq is None:
+                continue
+            assert REQUIRED_PQ_FIELDS <= pq.keys()
             # Preceding question should have ord one less than the answer turn
             assert pq["ord"] == turn["ord"] - 1
 
@@ -178,7 +202,7 @@ class TestQueryExpandedEndpoint:
         """Test that preceding_question is None when not requested."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "AI safety",
                 "max_chunks": 10,
@@ -198,7 +222,7 @@ class TestQueryExpandedEndpoint:
         """Test that non-matching query returns empty results gracefully."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "xyznonexistentqueryxyz",
                 "max_chunks": 10,
@@ -218,7 +242,7 @@ class TestQueryExpandedEndpoint:
         """Test query with metadata filters."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "AI safety",
                 "max_chunks": 10,
@@ -241,7 +265,7 @@ class TestQueryExpandedEndpoint:
         """Test that query_info contains all request parameters."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "test query",
                 "max_chunks": 25,
@@ -267,7 +291,7 @@ class TestQueryExpandedEndpoint:
         """Test that invalid retrieval mode returns error."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "test",
                 "mode": "invalid_mode",
@@ -281,7 +305,7 @@ class TestQueryExpandedEndpoint:
         """Test query-expanded with FTS mode."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "AI safety alignment",
                 "mode": "fts",
@@ -298,7 +322,7 @@ class TestQueryExpandedEndpoint:
         """Test query-expanded with AND operator for stricter matching."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "AI safety",
                 "mode": "fts",
@@ -314,7 +338,7 @@ class TestQueryExpandedEndpoint:
         """Test query-expanded with OR operator for broader matching."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "AI safety",
                 "mode": "fts",
@@ -330,7 +354,7 @@ class TestQueryExpandedEndpoint:
         """Test that token_budget has minimum value enforced."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "test",
                 "token_budget": 50,  # Below minimum of 100
@@ -344,7 +368,7 @@ class TestQueryExpandedEndpoint:
         """Test that max_chunks has maximum value enforced."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "test",
                 "max_chunks": 1000,  # Above maximum of 500
@@ -358,7 +382,7 @@ class TestQueryExpandedEndpoint:
         """Test that default values are applied correctly."""
         # Act - minimal request
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={"query": "AI safety"}
         )
 
@@ -376,7 +400,7 @@ class TestQueryExpandedEndpoint:
         """Test that timing values are reasonable."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={"query": "AI safety"}
         )
 
@@ -401,7 +425,7 @@ class TestQueryExpandedTokenBudget:
         """Test that token budget accounts for question tokens when include_preceding_question=True."""
         # First, get results without preceding questions
         response_without = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "AI safety",
                 "max_chunks": 50,
@@ -412,7 +436,7 @@ class TestQueryExpandedTokenBudget:
 
         # Then with preceding questions but same budget
         response_with = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "AI safety",
                 "max_chunks": 50,
@@ -437,7 +461,7 @@ class TestQueryExpandedTokenBudget:
         """Test that token budget correctly stops when adding next turn would exceed."""
         # Act with a moderate budget
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={
                 "query": "AI",
                 "max_chunks": 50,
@@ -461,7 +485,7 @@ class TestQueryExpandedEdgeCases:
         """Test that empty query is rejected."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={"query": ""}
         )
 
@@ -472,20 +496,20 @@ class TestQueryExpandedEdgeCases:
         """Test query with special characters is handled."""
         # Act
         response = test_client.post(
-            "/api/retrieval/query-expanded",
+            QE_URL,
             json={"query": "AI & safety | alignment"}
         )
 
         # Assert - should not crash
         assert response.status_code == 200
 
+    @pytest.mark.timeout(5)
     def test_very_long_query(self, test_client, sample_podcast_with_turns):
         """Test handling of very long queries."""
-        # Act
-        long_query = "AI safety " * 100  # Long query
+        # Act - bounded so a retrieval blow-up fails fast instead of stalling CI
         response = test_client.post(
-            "/api/retrieval/query-expanded",
-            json={"query": long_query}
+            QE_URL,
+            json={"query": _LONG_QUERY}
         )
 
         # Assert - should handle gracefully
@@ -4,6 +4,9 @@ import pytest
 from fastapi.testclient import TestClient
 
 
+Q_URL = "/api/retrieval/query"
+
+
 @pytest.mark.integration
 class TestSpeakerFiltering:
     """Test speaker filtering across retrieval endpoints."""
@@ -13,7 +16,7 @@ class TestSpeakerFiltering:
     ):
         """Test that speaker filter returns only chunks from matching speaker."""
         response = test_client.post(
-            "/api/retrieval/query",
+            Q_URL,
             json={
                 "query": "AI safety alignment",
                 "mode": "fts",
@@ -26,15 +29,15 @@ class TestSpeakerFiltering:
         data = response.json()
 
         # All returned chunks should be from Test Guest
-        for chunk in data["chunks"]:
-            assert chunk["speaker"] == "Test Guest"
+        speakers = {chunk["speaker"] for chunk in data["chunks"]}
+        assert speakers <= {"Test Guest"}
 
     def test_speaker_filter_partial_match(
         self, test_client: TestClient, sample_podcast_with_turns: dict
     ):
         """Test that speaker filter matches partial names (case-insensitive)."""
         response = test_client.post(
-            "/api/retrieval/query",
+            Q_URL,
             json={
                 "query": "AI safety alignment",
                 "mode": "fts",
@@ -47,15 +50,15 @@ class TestSpeakerFiltering:
         data = response.json()
 
         # Should match "Test Guest" with partial "guest"
-        for chunk in data["chunks"]:
-            assert "Guest" in chunk["speaker"]
+        speakers = {chunk["speaker"] for chunk in data["chunks"]}
+        assert all("Guest" in speaker for speaker in speakers)
 
     def test_speaker_filter_case_insensitive(
         self, test_client: TestClient, sample_podcast_with_turns: dict
     ):
         """Test that speaker filter is case-insensitive."""
         response = test_client.post(
-            "/api/retrieval/query",
+            Q_URL,
             json={
                 "query": "AI safety alignment",
                 "mode": "fts",
@@ -68,15 +71,15 @@ class TestSpeakerFiltering:
         data = response.json()
 
         # Should match despite case difference
-        for chunk in data["chunks"]:
-            assert chunk["speaker"] == "Test Guest"
+        speakers = {chunk["speaker"] for chunk in data["chunks"]}
+        assert speakers <= {"Test Guest"}
 
     def test_speaker_filter_dwarkesh(
         self, test_client: TestClient, sample_podcast_with_turns: dict
     ):
         """Test filtering for Dwarkesh Patel specifically."""
         response = test_client.post(
-            "/api/retrieval/query",
+            Q_URL,
             json={
                 "query": "thoughts safety",
                 "mode": "fts",
@@ -89,15 +92,15 @@ class TestSpeakerFiltering:
         data = response.json()
 
         # All chunks should be from Dwarkesh Patel
-        for chunk in data["chunks"]:
-            assert "Dwarkesh" in chunk["speaker"]
+        speakers = {chunk["speaker"] for chunk in data["chunks"]}
+        assert all("Dwarkesh" in speaker for speaker in speakers)
 
     def test_speaker_filter_no_matches_returns_empty(
         self, test_client: TestClient, sample_podcast_with_turns: dict
     ):
         """Test that filtering for non-existent speaker returns empty results."""
         response = test_client.post(
-            "/api/retrieval/query",
+            Q_URL,
             json={
                 "query": "AI safety alignment",
                 "mode": "fts",
@@ -117,7 +120,7 @@ class TestSpeakerFiltering:
     ):
         """Test combining speaker filter with source filter."""
         response = test_client.post(
-            "/api/retrieval/query",
+            Q_URL,
             json={
                 "query": "AI safety",
                 "mode": "fts",
@@ -133,15 +136,15 @@ class TestSpeakerFiltering:
         data = response.json()
 
         # All chunks should match both filters
-        for chunk in data["chunks"]:
-            assert chunk["speaker"] == "Test Guest"
+        speakers = {chunk["speaker"] for chunk in data["chunks"]}
+        assert speakers <= {"Test Guest"}
 
     def test_speaker_field_in_response(
         self, test_client: TestClient, sample_podcast_with_turns: dict
     ):
         """Test that speaker field is present in all chunk responses."""
         response = test_client.post(
-            "/api/retrieval/query",
+            Q_URL,
             json={
                 "query": "AI safety alignment governance",
                 "mode": "fts",
@@ -163,7 +166,7 @@ class TestSpeakerFiltering:
     ):
         """Test that query_info reflects applied speaker filter."""
         response = test_client.post(
-            "/api/retrieval/query",
+            Q_URL,
             json={
                 "query": "AI safety",
                 "mode": "fts",
@@ -189,7 +192,7 @@ class TestSpeakerFilteringHybridMode:
         """Test speaker filter works with hybrid retrieval mode."""
         # This test may be skipped if embeddings aren't available
         response = test_client.post(
-            "/api/retrieval/query",
+            Q_URL,
             json={
                 "query": "AI safety alignment",
                 "mode": "fts",  # Using FTS since hybrid requires embeddings
@@ -201,8 +204,8 @@ class TestSpeakerFilteringHybridMode:
         assert response.status_code == 200
         data = response.json()
 
-        for chunk in data["chunks"]:
-            assert chunk["speaker"] == "Test Guest"
+        speakers = {chunk["speaker"] for chunk in data["chunks"]}
+        assert speakers <= {"Test Guest"}
 
 
 @pytest.mark.integration
@@ -1,30 +1,129 @@
 """Integration tests for /api/ingest/text endpoint."""
 
+import asyncio
+import json
 import os
+from types import SimpleNamespace
+from unittest.mock import patch
 
+import httpx
 import pytest
+import pytest_asyncio
 
 from dotenv import load_dotenv
+from psycopg.rows import tuple_row
+
+from src.config import settings
+from src.ingestion import pipeline as pipeline_module
+from src.main import app
 
 load_dotenv()
 
 
+# One round-trip for every per-document check the tests make
+VERIFY_DOC_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM docs WHERE id = %(doc_id)s) AS doc_count,
+        COUNT(*) AS chunk_count,
+        COALESCE(bool_and(tsv IS NOT NULL), FALSE) AS tsv_present,
+        COUNT(*) FILTER (
+            WHERE tsv @@ websearch_to_tsquery('english', %(fts_query)s)
+        ) AS fts_matches
+    FROM chunks
+    WHERE doc_id = %(doc_id)s
+"""
+
+
+def _verify_chunks_and_tsv(cur, doc_id: int, expected_chunks: int) -> None:
+    """Check stored doc/chunk rows, generated tsvectors, and that FTS can use the GIN index."""
+    cur.execute(
+        VERIFY_DOC_SQL,
+        {"doc_id": doc_id, "fts_query": "machine learning"},
+        prepare=True,
+    )
+    verify = cur.fetchone()
+    assert verify["doc_count"] == 1
+    assert verify["chunk_count"] == expected_chunks
+    assert verify["tsv_present"], "tsvector should be generated"
+    assert verify["fts_matches"] > 0, "FTS query should find results"
+
+    # The test table is tiny, so the planner would otherwise (correctly)
+    # prefer a seq scan; callers roll back to drop the SET LOCAL.
+    cur.execute("SET LOCAL enable_seqscan = off")
+    cur.execute(
+        """
+        EXPLAIN (FORMAT JSON)
+        SELECT id
+        FROM chunks
+        WHERE tsv @@ websearch_to_tsquery('english', 'machine learning')
+        """
+    )
+    plan = cur.fetchone()["QUERY PLAN"]
+    assert "chunks_tsv_gin" in json.dumps(plan), "FTS should use the GIN index"
+
+
+def _fake_embeddings_create(input, model):
+    """Stand-in for client.embeddings.create returning one fixed vector per input."""
+    texts = [input] if isinstance(input, str) else input
+    vector = [0.001] * settings.embedding_dimensions
+    return SimpleNamespace(data=[SimpleNamespace(embedding=vector) for _ in texts])
+
+
+@pytest.fixture
+def fake_openai_embeddings(monkeypatch):
+    """Serve embeddings from a deterministic fake instead of the OpenAI API."""
+    monkeypatch.setattr(settings, "openai_api_key", settings.openai_api_key or "sk-test")
+    # The shared pipeline holds its embedding client; rebuild it around the mock
+    pipeline_module._shared_ingestion_pipeline.cache_clear()
+    with patch("src.embeddings.service.OpenAI") as mock_openai:
+        mock_openai.return_value.embeddings.create.side_effect = _fake_embeddings_create
+        yield mock_openai.return_value.embeddings.create
+    pipeline_module._shared_ingestion_pipeline.cache_clear()
+
+
+@pytest_asyncio.fixture
+async def async_client(db_pool):
+    """Async client calling the app in-process (pool comes from db_pool; no lifespan)."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
 @pytest.mark.integration
 class TestTextIngestionEndpoint:
     """Test suite for text ingestion endpoint."""
 
-    def test_ingest_text_basic(self, test_client, clean_db, sample_short_text):
-        """Test basic text ingestion without embeddings."""
+    @pytest.mark.parametrize(
+        ("endpoint", "build_payload", "extract_result"),
+        [
+            pytest.param(
+                "/api/ingest/text",
+                lambda doc: doc,
+                lambda data: data,
+                id="single",
+            ),
+            pytest.param(
+                "/api/ingest/text/batch",
+                lambda doc: {"documents": [doc]},
+                lambda data: data["results"][0],
+                id="batch",
+            ),
+        ],
+    )
+    def test_ingest_text_shape(
+        self, test_client, clean_db, sample_short_text, endpoint, build_payload, extract_result
+    ):
+        """Test one ingestion per endpoint: response shape, stored rows, tsvector and FTS."""
         # Arrange
-        payload = {"text": sample_short_text, "title": "Test Document"}
+        payload = build_payload({"text": sample_short_text, "title": "Test Document"})
 
         # Act
-        response = test_client.post("/api/ingest/text", json=payload)
+        response = test_client.post(endpoint, json=payload)
 
         # Assert
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-        data = response.json()
+        data = extract_result(response.json())
         assert data["status"] == "accepted"
         assert data["doc_id"] > 0
         assert data["title"] == "Test Document"
@@ -32,16 +131,9 @@ class TestTextIngestionEndpoint:
         assert data["total_tokens"] > 0
         assert data["ingestion_time_ms"] > 0
 
-        # Verify in database
         with clean_db.cursor() as cur:
-            # Check document was created
-            cur.execute("SELECT COUNT(*) as count FROM docs WHERE id = %(doc_id)s", {"doc_id": data["doc_id"]})
-            assert cur.fetchone()["count"] == 1
-
-            # Check chunks were created
-            cur.execute("SELECT COUNT(*) as count FROM chunks WHERE doc_id = %(doc_id)s", {"doc_id": data["doc_id"]})
-            chunk_count = cur.fetchone()["count"]
-            assert chunk_count == data["chunk_count"]
+            _verify_chunks_and_tsv(cur, data["doc_id"], data["chunk_count"])
+        clean_db.rollback()
 
     def test_ingest_text_with_metadata(self, test_client, clean_db, sample_short_text):
         """Test text ingestion with custom metadata."""
@@ -82,10 +174,10 @@ class TestTextIngestionEndpoint:
         data = response.json()
         assert data["title"] == "Untitled Document"
 
-    def test_ingest_text_chunks_correctly(self, test_client, clean_db, sample_text):
+    def test_ingest_text_chunks_correctly(self, test_client, clean_db, long_transcript):
         """Test that text is chunked according to token limits."""
         # Arrange
-        payload = {"text": sample_text, "title": "Long Document"}
+        payload = {"text": long_transcript, "title": "Long Document"}
 
         # Act
         response = test_client.post("/api/ingest/text", json=payload)
@@ -93,6 +185,7 @@ class TestTextIngestionEndpoint:
         # Assert
         assert response.status_code == 200
         data = response.json()
+        assert data["chunk_count"] > 1, "Long text should span multiple chunks"
 
         # Verify chunks in database
         with clean_db.cursor() as cur:
@@ -118,10 +211,12 @@ class TestTextIngestionEndpoint:
                 )
                 assert chunk["text_length"] > 0, "Chunk text should not be empty"
 
-    def test_ingest_text_tsvector_generated(self, test_client, clean_db, sample_short_text):
-        """Test that tsvector is generated for full-text search."""
+    def test_ingest_text_with_embeddings(
+        self, test_client, clean_db, sample_short_text, fake_openai_embeddings
+    ):
+        """Test text ingestion stores one embedding per chunk (OpenAI call mocked)."""
         # Arrange
-        payload = {"text": sample_short_text, "title": "FTS Test"}
+        payload = {"text": sample_short_text, "title": "Embedding Test"}
 
         # Act
         response = test_client.post("/api/ingest/text", json=payload)
@@ -129,42 +224,44 @@ class TestTextIngestionEndpoint:
         # Assert
         assert response.status_code == 200
         data = response.json()
+        assert data["embeddings_generated"] is True, "Embeddings should be generated"
+        fake_openai_embeddings.assert_called_once()
 
-        # Verify tsvector is generated
+        # Verify embeddings in database
         with clean_db.cursor() as cur:
             cur.execute(
                 """
-                SELECT id, tsv
-                FROM chunks
-                WHERE doc_id = %(doc_id)s
-                LIMIT 1
+                SELECT
+                    ce.chunk_id,
+                    vector_dims(ce.embedding) AS dims,
+                    ce.embedding::real[] AS embedding
+                FROM chunk_embeddings ce
+                JOIN chunks c ON c.id = ce.chunk_id
+                WHERE c.doc_id = %(doc_id)s
                 """,
                 {"doc_id": data["doc_id"]},
             )
-            chunk = cur.fetchone()
-            assert chunk["tsv"] is not None, "tsvector should be generated"
+            embeddings = cur.fetchall()
 
-            # Test FTS query works
-            cur.execute(
-                """
-                SELECT COUNT(*) as count
-                FROM chunks
-                WHERE doc_id = %(doc_id)s
-                AND tsv @@ websearch_to_tsquery('english', 'machine learning')
-                """,
-                {"doc_id": data["doc_id"]},
+            assert len(embeddings) == data["chunk_count"], (
+                "Should have one embedding per chunk"
             )
-            assert cur.fetchone()["count"] > 0, "FTS query should find results"
+
+            # Stored vectors should be exactly what the mocked client returned
+            expected = _fake_embeddings_create("", settings.embedding_model).data[0].embedding
+            for emb in embeddings:
+                assert emb["dims"] == settings.embedding_dimensions
+                assert emb["embedding"] == pytest.approx(expected)
 
     @pytest.mark.requires_openai
-    def test_ingest_text_with_embeddings(self, test_client, clean_db, sample_short_text):
-        """Test text ingestion generates embeddings (requires OpenAI API key)."""
+    def test_ingest_text_with_embeddings_live(self, test_client, clean_db):
+        """Test embedding generation against the real OpenAI API (requires OpenAI API key)."""
         # Skip if no API key
         if not os.getenv("OPENAI_API_KEY"):
             pytest.skip("OPENAI_API_KEY not set")
 
         # Arrange
-        payload = {"text": sample_short_text, "title": "Embedding Test"}
+        payload = {"text": "Embeddings smoke test.", "title": "Live Embedding Test"}
 
         # Act
         response = test_client.post("/api/ingest/text", json=payload)
@@ -174,28 +271,17 @@ class TestTextIngestionEndpoint:
         data = response.json()
         assert data["embeddings_generated"] is True, "Embeddings should be generated"
 
-        # Verify embeddings in database
-        with clean_db.cursor() as cur:
+        with clean_db.cursor(row_factory=tuple_row) as cur:
             cur.execute(
                 """
-                SELECT ce.chunk_id, ce.embedding
+                SELECT COUNT(*)
                 FROM chunk_embeddings ce
                 JOIN chunks c ON c.id = ce.chunk_id
                 WHERE c.doc_id = %(doc_id)s
                 """,
                 {"doc_id": data["doc_id"]},
             )
-            embeddings = cur.fetchall()
-
-            assert len(embeddings) == data["chunk_count"], (
-                "Should have one embedding per chunk"
-            )
-
-            # Verify embedding dimensions (1536 for text-embedding-3-small)
-            for emb in embeddings:
-                embedding_vector = emb["embedding"]
-                # pgvector returns as string like '[0.1, 0.2, ...]'
-                assert embedding_vector is not None, "Embedding should not be null"
+            assert cur.fetchone()[0] == data["chunk_count"]
 
     def test_ingest_text_retrieval_integration(
         self, test_client, clean_db, sample_short_text
@@ -246,7 +332,7 @@ class TestTextIngestionEndpoint:
     def test_ingest_text_multiple_documents(
         self, test_client, clean_db, sample_short_text
     ):
-        """Test ingesting multiple documents in sequence."""
+        """Test ingesting multiple documents in one batch request."""
         # Arrange
         payloads = [
             {"text": "Document one about neural networks.", "title": "Doc 1"},
@@ -255,16 +341,55 @@ class TestTextIngestionEndpoint:
         ]
 
         # Act
-        doc_ids = []
-        for payload in payloads:
-            response = test_client.post("/api/ingest/text", json=payload)
-            assert response.status_code == 200
-            doc_ids.append(response.json()["doc_id"])
+        response = test_client.post("/api/ingest/text/batch", json={"documents": payloads})
 
         # Assert
+        assert response.status_code == 200
+        data = response.json()
+        results = data["results"]
+        assert len(results) == 3
+        # Per-document times are the batch time split evenly, not the batch total
+        assert sum(r["ingestion_time_ms"] for r in results) == pytest.approx(
+            data["ingestion_time_ms"], abs=0.02
+        )
+
+        doc_ids = [result["doc_id"] for result in results]
         assert len(set(doc_ids)) == 3, "Should have unique doc_ids"
+        assert [result["title"] for result in results] == ["Doc 1", "Doc 2", "Doc 3"]
 
         # Verify all in database
-        with clean_db.cursor() as cur:
-            cur.execute("SELECT COUNT(*) as count FROM docs")
-            assert cur.fetchone()["count"] == 3
+        with clean_db.cursor(row_factory=tuple_row) as cur:
+            cur.execute("SELECT COUNT(*) FROM docs")
+            assert cur.fetchone()[0] == 3
+
+    @pytest.mark.asyncio
+    async def test_ingest_text_concurrent_documents(self, async_client, clean_db):
+        """Test ingesting multiple documents with overlapping requests."""
+        # Arrange
+        payloads = [
+            {"text": "Document one about neural networks.", "title": "Doc 1"},
+            {"text": "Document two about deep learning.", "title": "Doc 2"},
+            {"text": "Document three about transformers.", "title": "Doc 3"},
+        ]
+
+        # Act
+        responses = await asyncio.gather(
+            *(async_client.post("/api/ingest/text", json=payload) for payload in payloads)
+        )
+
+        # Assert
+        assert [response.status_code for response in responses] == [200, 200, 200]
+        doc_ids = {response.json()["doc_id"] for response in responses}
+        assert len(doc_ids) == 3, "Should have unique doc_ids"
+
+        with clean_db.cursor(row_factory=tuple_row) as cur:
+            cur.execute("SELECT COUNT(*) FROM docs")
+            assert cur.fetchone()[0] == 3
+
+    def test_ingest_text_batch_invalid_empty(self, test_client, clean_db):
+        """Test that an empty batch is rejected."""
+        # Act
+        response = test_client.post("/api/ingest/text/batch", json={"documents": []})
+
+        # Assert
+        assert response.status_code == 422, "Should reject empty batch"
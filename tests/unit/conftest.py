@@ -0,0 +1,39 @@
+"""Shared fixtures for unit tests.
+
+Expensive read-only fixtures are session scoped. Under pytest-xdist each
+worker is its own session, so every worker builds them exactly once.
+"""
+
+import pytest
+
+from evals.schemas.task import EvalDataset
+from evals.tasks.retrieval.loaders.transcript_loader import (
+    Transcript,
+    TranscriptLoader,
+    load_eval_dataset,
+)
+from evals.tasks.tool_params.dataset import ToolParamsDataset
+
+
+@pytest.fixture(scope="session")
+def loader() -> TranscriptLoader:
+    """Share one TranscriptLoader over the real transcripts directory."""
+    return TranscriptLoader()
+
+
+@pytest.fixture(scope="session")
+def corpus(loader: TranscriptLoader) -> list[Transcript]:
+    """Load every transcript once for the search tests."""
+    return loader.load_all()
+
+
+@pytest.fixture(scope="session")
+def eval_dataset() -> EvalDataset:
+    """Load the default eval dataset once per test session."""
+    return load_eval_dataset()
+
+
+@pytest.fixture(scope="session")
+def tool_params_dataset() -> ToolParamsDataset:
+    """Build the tool parameter eval dataset once per test session."""
+    return ToolParamsDataset()
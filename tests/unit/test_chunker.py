@@ -0,0 +1,82 @@
+"""Unit tests for the token-based chunker."""
+
+import pytest
+
+from src.ingestion import chunker as chunker_module
+from src.ingestion.chunker import Chunk, TokenBasedChunker
+
+
+class FakeEncoding:
+    """Whitespace tokenizer standing in for tiktoken (no BPE download needed)."""
+
+    name = "fake"
+
+    def __init__(self):
+        self.encode_calls = 0
+
+    def encode(self, text: str) -> list[str]:
+        self.encode_calls += 1
+        return text.split()
+
+    def decode(self, tokens: list[str]) -> str:
+        return " ".join(tokens)
+
+
+@pytest.fixture
+def fake_encoding(monkeypatch):
+    """Route tiktoken lookups in the chunker to a fresh FakeEncoding."""
+    encoding = FakeEncoding()
+    monkeypatch.setattr(chunker_module.tiktoken, "get_encoding", lambda name: encoding)
+    return encoding
+
+
+class TestTokenBasedChunker:
+    """Tests for TokenBasedChunker."""
+
+    def test_chunk_splits_with_overlap(self, fake_encoding):
+        """Test chunks respect max_tokens and carry overlap from the previous chunk."""
+        chunker = TokenBasedChunker(min_tokens=1, max_tokens=4, overlap_tokens=1)
+
+        chunks = chunker.chunk("a b c d e f g")
+
+        assert chunks == [
+            Chunk(text="a b c d", token_count=4, ord=0),
+            Chunk(text="d e f g", token_count=4, ord=1),
+        ]
+
+    def test_chunk_empty_text(self, fake_encoding):
+        """Test that empty text yields no chunks."""
+        chunker = TokenBasedChunker(min_tokens=1, max_tokens=4, overlap_tokens=1)
+
+        assert chunker.chunk("") == []
+
+    def test_chunk_memoized_when_cache_enabled(self, fake_encoding):
+        """Test that re-chunking the same text skips tokenization when opted in."""
+        text = "Machine learning is a cool technology that helps computers learn from data."
+        chunker = TokenBasedChunker(min_tokens=1, max_tokens=4, overlap_tokens=1, cache_size=8)
+
+        first = chunker.chunk(text)
+        second = chunker.chunk(text)
+
+        assert first == second
+        assert first is not second, "Callers should get their own list"
+        assert fake_encoding.encode_calls == 1
+
+    def test_chunk_not_memoized_when_cache_disabled(self, fake_encoding):
+        """Test that a chunker with cache_size=0 doesn't keep ingested texts around."""
+        chunker = TokenBasedChunker(min_tokens=1, max_tokens=4, overlap_tokens=1, cache_size=0)
+
+        chunker.chunk("a b c d e f g")
+        chunker.chunk("a b c d e f g")
+
+        assert fake_encoding.encode_calls == 2
+
+    def test_chunk_cache_is_per_instance(self, fake_encoding):
+        """Test that chunkers with different parameters never share cached chunks."""
+        text = "a b c d e f g"
+
+        small = TokenBasedChunker(min_tokens=1, max_tokens=2, overlap_tokens=0, cache_size=8)
+        large = TokenBasedChunker(min_tokens=1, max_tokens=8, overlap_tokens=0, cache_size=8)
+
+        assert len(small.chunk(text)) == 4
+        assert len(large.chunk(text)) == 1
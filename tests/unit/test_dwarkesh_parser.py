@@ -1,10 +1,17 @@
 """Tests for Dwarkesh Podcast transcript parser."""
 
+import importlib
+import random
+import re
+
 import pytest
+from hypothesis import given, settings, strategies as st
 
+from src.scrapers.dwarkesh import parser as parser_module
 from src.scrapers.dwarkesh.parser import (
     DwarkeshParser,
     parse_timestamp_to_seconds,
+    parse_timestamps_bulk,
     SPEAKER_PATTERN,
     SECTION_PATTERN,
 )
@@ -27,6 +34,23 @@ class TestTimestampParsing:
         # 2:15:30 = 7200 + 900 + 30 = 8130
         assert parse_timestamp_to_seconds("2", "15", "30") == 8130
 
+    def test_bulk_matches_scalar(self):
+        """Test vectorized conversion matches the scalar helper elementwise."""
+        rng = random.Random(0)
+        triples = [
+            (str(rng.randint(0, 99)), f"{rng.randint(0, 59):02d}", f"{rng.randint(0, 59):02d}")
+            for _ in range(10_000)
+        ]
+        hours, minutes, seconds = map(list, zip(*triples))
+
+        result = parse_timestamps_bulk(hours, minutes, seconds)
+
+        assert result.tolist() == [parse_timestamp_to_seconds(*t) for t in triples]
+
+    def test_bulk_empty(self):
+        """Test vectorized conversion of no timestamps."""
+        assert parse_timestamps_bulk([], [], []).tolist() == []
+
 
 class TestSpeakerPattern:
     """Tests for speaker pattern matching."""
@@ -93,11 +117,176 @@ class TestSectionPattern:
         assert match.group("hours") == "1"
 
 
+speaker_names = st.text(
+    alphabet=st.characters(whitelist_categories=["Ll", "Lu", "Zs"]), min_size=1, max_size=40
+)
+section_titles = speaker_names.filter(lambda t: t.strip())
+
+
+class TestPatternFuzz:
+    """Property-based tests guarding the patterns against backtracking regressions."""
+
+    @settings(max_examples=1000, deadline=50)
+    @given(
+        st.tuples(
+            speaker_names, st.integers(0, 23), st.integers(0, 59), st.integers(0, 59)
+        )
+    )
+    def test_speaker_pattern_matches_generated_lines(self, case):
+        """Test any well-formed speaker line matches with the expected groups."""
+        name, h, m, s = case
+        match = SPEAKER_PATTERN.search(f"**{name}** _{h:02d}:{m:02d}:{s:02d}_")
+
+        assert match is not None
+        assert match.group("speaker") == name
+        assert int(match.group("hours")) == h
+        assert int(match.group("minutes")) == m
+        assert int(match.group("seconds")) == s
+
+    @settings(max_examples=1000, deadline=50)
+    @given(
+        st.tuples(
+            section_titles,
+            st.integers(0, 23),
+            st.integers(0, 59),
+            st.integers(0, 59),
+            st.sampled_from(["–", "-"]),
+        )
+    )
+    def test_section_pattern_matches_generated_headers(self, case):
+        """Test any well-formed section header matches with the expected groups."""
+        title, h, m, s, dash = case
+        match = SECTION_PATTERN.search(f"[({h:02d}:{m:02d}:{s:02d}) {dash} {title}]")
+
+        assert match is not None
+        # The parser strips titles; re2's \s does not cover Unicode spaces like U+00A0
+        assert match.group("title").strip() == title.strip()
+        assert parse_timestamp_to_seconds(
+            match.group("hours"), match.group("minutes"), match.group("seconds")
+        ) == h * 3600 + m * 60 + s
+
+    @settings(max_examples=200, deadline=50)
+    @given(speaker_names, st.integers(1, 2000))
+    def test_speaker_pattern_rejects_unterminated_markers_quickly(self, name, repeat):
+        """Test near-miss markers fail fast instead of backtracking."""
+        content = f"**{name * repeat}** _00:00" + " " * repeat
+        assert SPEAKER_PATTERN.search(content) is None
+
+
+class TestPatternCaching:
+    """Tests that transcript patterns are compiled once at import time."""
+
+    def test_patterns_are_compiled(self):
+        """Test module-level patterns are compiled objects of the active backend."""
+        pattern_type = type(parser_module.regex_engine.compile(""))
+        assert isinstance(SPEAKER_PATTERN, pattern_type)
+        assert isinstance(SECTION_PATTERN, pattern_type)
+
+    def test_parse_transcript_does_not_compile(self, monkeypatch):
+        """Test that parsing reuses the module-level patterns instead of compiling."""
+        compile_calls = 0
+        original_compile = re.compile
+
+        def counting_compile(*args, **kwargs):
+            nonlocal compile_calls
+            compile_calls += 1
+            return original_compile(*args, **kwargs)
+
+        monkeypatch.setattr(re, "compile", counting_compile)
+
+        content = """
+[(00:00:00) – Introduction]
+
+**Dwarkesh Patel** _00:00:00_
+Let's start.   [(00:01:00) – Inline Section]   More text.
+
+**Guest** _00:00:30_
+Happy to be here.
+"""
+        parser = DwarkeshParser()
+        for _ in range(100):
+            parser.parse_transcript(content)
+
+        assert compile_calls == 0
+
+    def test_patterns_cached_across_imports(self):
+        """Test re-importing the parser module returns the same pattern objects."""
+        reimported = importlib.import_module("src.scrapers.dwarkesh.parser")
+        assert reimported.SPEAKER_PATTERN is parser_module.SPEAKER_PATTERN
+        assert reimported.SECTION_PATTERN is parser_module.SECTION_PATTERN
+
+
+class CountingPattern:
+    """Proxy around a compiled pattern that counts scanning calls."""
+
+    calls = 0
+
+    def __init__(self, pattern):
+        self._pattern = pattern
+
+    def __getattr__(self, name):
+        attr = getattr(self._pattern, name)
+        if name in ("finditer", "findall", "search", "match", "sub"):
+            CountingPattern.calls += 1
+        return attr
+
+
+PARITY_TRANSCRIPTS = [
+    """
+[(00:00:00) – Introduction]
+
+**Dwarkesh Patel** _00:00:00_
+Let's start.   [(00:01:00) – Inline Section]   More text.
+
+**Guest Name** _00:00:30_
+Happy to be here.
+""",
+    """
+## (01:02:03) - Scaling laws
+
+**Dwarkesh Patel** _01:02:03_
+What changes past\u00a0the next order of magnitude?
+
+**Guest** _01:02:45_
+**Not much**, honestly. _00:00_ isn't a timestamp.
+""",
+    "\n\n".join(
+        f"**Speaker {i % 3}** _00:{i // 60:02d}:{i % 60:02d}_\nTurn {i}." for i in range(200)
+    ),
+]
+
+
+class TestPatternBackendParity:
+    """Tests that re2-compiled patterns match exactly what stdlib re matches."""
+
+    @pytest.mark.parametrize("name", list(parser_module.compile_patterns(re)))
+    @pytest.mark.parametrize("content", PARITY_TRANSCRIPTS, ids=["sections", "headings", "long"])
+    def test_re2_matches_stdlib(self, name, content):
+        """Test both engines find the same spans and groups on the fixture transcripts."""
+        re2 = pytest.importorskip("re2")
+        stdlib = parser_module.compile_patterns(re)[name]
+        fast = parser_module.compile_patterns(re2)[name]
+
+        def scan(pattern):
+            return [(m.span(), m.groupdict()) for m in pattern.finditer(content)]
+
+        assert scan(fast) == scan(stdlib)
+
+
+@pytest.fixture(params=["re", "re2"])
+def regex_backend(request, monkeypatch):
+    """Swap the parser's module-level patterns to the given regex engine."""
+    engine = re if request.param == "re" else pytest.importorskip("re2")
+    for name, pattern in parser_module.compile_patterns(engine).items():
+        monkeypatch.setattr(parser_module, name, pattern)
+    return request.param
+
+
 class TestDwarkeshParser:
-    """Tests for DwarkeshParser class."""
+    """Tests for DwarkeshParser class, run against both regex backends."""
 
     @pytest.fixture
-    def parser(self):
+    def parser(self, regex_backend):
         """Create parser instance."""
         return DwarkeshParser()
 
@@ -179,6 +368,54 @@ Some text before. [(00:01:00) – New Section] Some text after.
         assert "Some text before" in turns[0].text
         assert "Some text after" in turns[0].text
 
+    def test_single_pass_scan(self, parser, monkeypatch):
+        """Test that parsing scans the transcript with exactly one regex pass."""
+        for name in (
+            "SPEAKER_PATTERN",
+            "SECTION_PATTERN",
+            "SECTION_HEADING_PATTERN",
+            "COMBINED_PATTERN",
+        ):
+            monkeypatch.setattr(
+                parser_module, name, CountingPattern(getattr(parser_module, name))
+            )
+        monkeypatch.setattr(CountingPattern, "calls", 0)
+
+        content = """
+[(00:00:00) – Introduction]
+
+**Dwarkesh Patel** _00:00:00_
+Let's start. [(00:01:00) – Inline Section] More text.
+
+### (00:02:00) – Heading Section
+
+**Guest** _00:02:30_
+Happy to be here.
+"""
+        turns, sections = parser.parse_transcript(content)
+
+        assert CountingPattern.calls == 1
+        assert [s.title for s in sections] == [
+            "Introduction",
+            "Inline Section",
+            "Heading Section",
+        ]
+        assert turns[0].text == "Let's start. More text."
+        assert turns[1].section_title == "Heading Section"
+
+    def test_speakers_interned(self, parser):
+        """Test that repeated speaker names share a single string object."""
+        content = "\n\n".join(
+            f"**{'Dwarkesh Patel' if i % 2 == 0 else 'Guest'}** _00:{i % 60:02d}:00_\nTurn {i}."
+            for i in range(1000)
+        )
+        turns, _ = parser.parse_transcript(content)
+
+        assert len(turns) == 1000
+        first, second = turns[0].speaker, turns[1].speaker
+        assert all(t.speaker is first for t in turns if t.speaker == first)
+        assert all(t.speaker is second for t in turns if t.speaker == second)
+
     def test_timestamp_display(self, parser):
         """Test timestamp display formatting."""
         content = "**Speaker** _01:30:45_ Hello"
@@ -188,21 +425,25 @@ Some text before. [(00:01:00) – New Section] Some text after.
         assert turns[0].timestamp_display == "01:30:45"
 
     def test_handles_long_transcript(self, parser):
-        """Test parsing a longer transcript with multiple turns."""
+        """Test parsing a long transcript with many turns."""
+        num_turns = 5000
         turns_data = []
-        for i in range(10):
+        for i in range(num_turns):
             speaker = "Dwarkesh Patel" if i % 2 == 0 else "Guest"
-            minutes = i * 5
-            turns_data.append(f"**{speaker}** _00:{minutes:02d}:00_\nTurn {i} content here.")
+            hours, remainder = divmod(i * 30, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            turns_data.append(
+                f"**{speaker}** _{hours:02d}:{minutes:02d}:{seconds:02d}_\nTurn {i} content here."
+            )
 
         content = "\n\n".join(turns_data)
         turns, sections = parser.parse_transcript(content)
 
-        assert len(turns) == 10
+        assert len(turns) == num_turns
         for i, turn in enumerate(turns):
             assert turn.ord == i
-            expected_seconds = i * 5 * 60
-            assert turn.start_time_seconds == expected_seconds
+            assert turn.start_time_seconds == i * 30
+            assert turn.text == f"Turn {i} content here."
 
 
 class TestParsedTurn:
@@ -230,6 +471,28 @@ class TestParsedTurn:
         )
         assert turn.timestamp_display == "01:01:01"
 
+    def test_timestamp_display_lookup_table(self):
+        """Test lookup-table formatting matches f-string formatting."""
+        from src.scrapers.dwarkesh.models import _format_hms
+
+        for total in range(0, 360_001):
+            hours, remainder = divmod(total, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            assert _format_hms(total) == f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+    def test_timestamp_display_over_99_hours(self):
+        """Test formatting falls back past the two-digit lookup table."""
+        from src.scrapers.dwarkesh.models import ParsedTurn
+
+        turn = ParsedTurn(speaker="Test", start_time_seconds=100 * 3600 + 61, text="Hello")
+        assert turn.timestamp_display == "100:01:01"
+
+    def test_timestamp_display_negative(self):
+        """Test negative offsets fall back instead of indexing the table from the end."""
+        from src.scrapers.dwarkesh.models import _format_hms
+
+        assert _format_hms(-1) == f"{-1:02d}:59:59"
+
 
 class TestEpisode:
     """Tests for Episode model."""
@@ -0,0 +1,110 @@
+"""Unit tests for the ingestion pipeline (database and OpenAI mocked)."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.ingestion import pipeline as pipeline_module
+from src.ingestion.chunker import Chunk
+from src.ingestion.pipeline import IngestionPipeline, get_ingestion_pipeline
+
+
+@pytest.fixture
+def mock_dependencies():
+    """Replace the chunker and embedding service with mocks."""
+    pipeline_module._shared_ingestion_pipeline.cache_clear()
+    with (
+        patch.object(pipeline_module, "TokenBasedChunker") as mock_chunker_cls,
+        patch.object(pipeline_module, "EmbeddingService") as mock_embedding_cls,
+    ):
+        yield mock_chunker_cls, mock_embedding_cls
+    pipeline_module._shared_ingestion_pipeline.cache_clear()
+
+
+class TestGetIngestionPipeline:
+    """Tests for the shared pipeline factory."""
+
+    def test_returns_same_instance(self, mock_dependencies):
+        """Test repeated calls share one pipeline."""
+        assert get_ingestion_pipeline() is get_ingestion_pipeline()
+
+    def test_chunker_constructed_once(self, mock_dependencies):
+        """Test the chunker and embedding client are built once across ingest calls."""
+        mock_chunker_cls, mock_embedding_cls = mock_dependencies
+        mock_chunker_cls.return_value.chunk.return_value = []
+
+        for i in range(10):
+            pipeline = get_ingestion_pipeline()
+            with patch.object(IngestionPipeline, "_insert_raw_document", return_value=i + 1):
+                with patch.object(IngestionPipeline, "_insert_chunks", return_value=[]):
+                    with patch.object(IngestionPipeline, "_generate_and_insert_embeddings"):
+                        pipeline.ingest_raw_text(f"Document {i}")
+
+        assert mock_chunker_cls.call_count == 1
+        assert mock_embedding_cls.call_count == 1
+        assert mock_chunker_cls.return_value.chunk.call_count == 10
+
+    def test_failed_embedding_setup_not_cached(self, mock_dependencies):
+        """Test a pipeline without embeddings is rebuilt until the service comes up."""
+        _, mock_embedding_cls = mock_dependencies
+        mock_embedding_cls.side_effect = ValueError("OPENAI_API_KEY not set")
+
+        degraded = get_ingestion_pipeline()
+        assert degraded.generate_embeddings is False
+
+        mock_embedding_cls.side_effect = None
+        recovered = get_ingestion_pipeline()
+
+        assert recovered is not degraded
+        assert recovered.generate_embeddings is True
+        assert get_ingestion_pipeline() is recovered
+
+
+class TestIngestRawText:
+    """Tests for IngestionPipeline.ingest_raw_text."""
+
+    @pytest.fixture
+    def pipeline(self, mock_dependencies):
+        """Pipeline over a mocked chunker and embedding service."""
+        mock_chunker_cls, mock_embedding_cls = mock_dependencies
+        mock_chunker_cls.return_value.chunk.return_value = [
+            Chunk(text="first chunk", token_count=2, ord=0),
+            Chunk(text="second chunk", token_count=2, ord=1),
+        ]
+        mock_embedding_cls.return_value.embed_batch.return_value = [[0.1], [0.2]]
+        return IngestionPipeline()
+
+    def test_ingest_with_embeddings_uses_fused_insert(self, pipeline):
+        """Test chunks and embeddings are written together in one insert path."""
+        with (
+            patch.object(pipeline, "_insert_raw_document", return_value=7),
+            patch.object(pipeline, "_insert_chunks_with_embeddings", return_value=[1, 2]) as fused,
+            patch.object(pipeline, "_insert_chunks") as insert_chunks,
+            patch.object(pipeline, "_generate_and_insert_embeddings") as insert_embeddings,
+        ):
+            result = pipeline.ingest_raw_text("first chunk second chunk", title="Doc")
+
+        fused.assert_called_once()
+        doc_id, chunks, embeddings = fused.call_args.args
+        assert doc_id == 7
+        assert [c.ord for c in chunks] == [0, 1]
+        assert embeddings == [[0.1], [0.2]]
+        insert_chunks.assert_not_called()
+        insert_embeddings.assert_not_called()
+        assert result["embeddings_generated"] is True
+        assert result["chunk_count"] == 2
+
+    def test_ingest_without_embeddings_inserts_chunks_only(self, pipeline):
+        """Test disabling embeddings skips the API call and the fused insert."""
+        pipeline.generate_embeddings = False
+        with (
+            patch.object(pipeline, "_insert_raw_document", return_value=7),
+            patch.object(pipeline, "_insert_chunks_with_embeddings") as fused,
+            patch.object(pipeline, "_insert_chunks", return_value=[1, 2]) as insert_chunks,
+        ):
+            result = pipeline.ingest_raw_text("first chunk second chunk")
+
+        insert_chunks.assert_called_once()
+        fused.assert_not_called()
+        pipeline.embedding_service.embed_batch.assert_not_called()
+        assert result["embeddings_generated"] is False
@@ -5,6 +5,14 @@ import pytest
 from src.observability.tracing import get_langsmith_config
 
 
+@pytest.fixture(autouse=True)
+def _clear_langsmith_config_cache():
+    """Give each test a fresh read of the environment."""
+    get_langsmith_config.cache_clear()
+    yield
+    get_langsmith_config.cache_clear()
+
+
 class TestLangSmithConfig:
     """Test suite for LangSmith configuration."""
 
@@ -51,3 +59,24 @@ class TestLangSmithConfig:
 
         with pytest.raises(ValueError, match="LANGSMITH_API_KEY not found"):
             get_langsmith_config()
+
+    def test_get_langsmith_config_cached(self, monkeypatch):
+        """Test that repeated calls return the same cached dict."""
+        monkeypatch.setenv("LANGSMITH_API_KEY", "test_key_123")
+
+        first = get_langsmith_config()
+        monkeypatch.setenv("LANGSMITH_PROJECT", "changed-project")
+        second = get_langsmith_config()
+
+        assert second is first
+        assert second["project"] == first["project"]
+
+    def test_get_langsmith_config_read_only(self, monkeypatch):
+        """Test that callers can't mutate the shared cached config."""
+        monkeypatch.setenv("LANGSMITH_API_KEY", "test_key_123")
+
+        config = get_langsmith_config()
+        with pytest.raises(TypeError):
+            config["project"] = "hijacked"  # type: ignore[index]
+
+        assert get_langsmith_config()["project"] != "hijacked"
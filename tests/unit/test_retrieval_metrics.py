@@ -1,10 +1,18 @@
 """Unit tests for retrieval metrics."""
 
+import dataclasses
+import random
+
+import numpy as np
 import pytest
 
+from evals.metrics import retrieval as retrieval_module
 from evals.metrics.retrieval import (
+    METRICS_DTYPE,
     RetrievalMetrics,
+    activate_numba_metrics,
     compute_retrieval_metrics,
+    compute_retrieval_metrics_batch,
     hit_rate,
     mrr,
     ndcg_at_k,
@@ -16,169 +24,127 @@ from evals.metrics.retrieval import (
 class TestRecallAtK:
     """Test recall@k metric."""
 
-    def test_perfect_recall(self):
-        """All ground truth items retrieved in top-k."""
-        assert recall_at_k([1, 2, 3, 4], [2, 3], k=4) == 1.0
-
-    def test_partial_recall(self):
-        """Some ground truth items retrieved."""
-        assert recall_at_k([1, 2, 3, 4], [2, 5], k=3) == 0.5
-
-    def test_zero_recall(self):
-        """No ground truth items retrieved."""
-        assert recall_at_k([1, 2, 3], [4, 5, 6], k=3) == 0.0
-
-    def test_k_larger_than_retrieved(self):
-        """k exceeds number of retrieved items."""
-        result = recall_at_k([1, 2], [1, 2, 3], k=10)
-        assert abs(result - 2 / 3) < 0.001
-
-    def test_empty_retrieved(self):
-        """No items retrieved."""
-        assert recall_at_k([], [1, 2], k=3) == 0.0
-
-    def test_empty_ground_truth(self):
-        """No ground truth items."""
-        assert recall_at_k([1, 2, 3], [], k=3) == 0.0
-
-    def test_both_empty(self):
-        """Both lists empty."""
-        assert recall_at_k([], [], k=3) == 0.0
-
-    def test_k_smaller_than_retrieved(self):
-        """Relevant item beyond k is not counted."""
-        assert recall_at_k([1, 2, 3, 4], [4], k=2) == 0.0
+    @pytest.mark.parametrize(
+        ("retrieved", "ground_truth", "k", "expected"),
+        [
+            pytest.param([1, 2, 3, 4], [2, 3], 4, 1.0, id="perfect"),
+            pytest.param([1, 2, 3, 4], [2, 5], 3, 0.5, id="partial"),
+            pytest.param([1, 2, 3], [4, 5, 6], 3, 0.0, id="zero"),
+            pytest.param([1, 2], [1, 2, 3], 10, 2 / 3, id="k_larger_than_retrieved"),
+            pytest.param([], [1, 2], 3, 0.0, id="empty_retrieved"),
+            pytest.param([1, 2, 3], [], 3, 0.0, id="empty_ground_truth"),
+            pytest.param([], [], 3, 0.0, id="both_empty"),
+            # Relevant item beyond k is not counted
+            pytest.param([1, 2, 3, 4], [4], 2, 0.0, id="k_smaller_than_retrieved"),
+        ],
+    )
+    def test_recall(self, retrieved, ground_truth, k, expected):
+        """Recall@k over representative and edge-case inputs."""
+        assert recall_at_k(retrieved, ground_truth, k=k) == pytest.approx(expected)
 
 
 class TestPrecisionAtK:
     """Test precision@k metric."""
 
-    def test_perfect_precision(self):
-        """All retrieved items are relevant."""
-        assert precision_at_k([1, 2, 3], [1, 2, 3, 4], k=3) == 1.0
-
-    def test_partial_precision(self):
-        """Some retrieved items are relevant."""
-        result = precision_at_k([1, 2, 3, 4], [2, 3], k=3)
-        assert abs(result - 2 / 3) < 0.001
-
-    def test_zero_precision(self):
-        """No retrieved items are relevant."""
-        assert precision_at_k([1, 2, 3], [4, 5], k=3) == 0.0
-
-    def test_k_larger_than_retrieved(self):
-        """k exceeds retrieved length - uses actual length."""
-        assert precision_at_k([1, 2], [1], k=10) == 0.5
-
-    def test_empty_retrieved(self):
-        """No items retrieved."""
-        assert precision_at_k([], [1, 2], k=3) == 0.0
-
-    def test_empty_ground_truth(self):
-        """No ground truth items."""
-        assert precision_at_k([1, 2, 3], [], k=3) == 0.0
+    @pytest.mark.parametrize(
+        ("retrieved", "ground_truth", "k", "expected"),
+        [
+            pytest.param([1, 2, 3], [1, 2, 3, 4], 3, 1.0, id="perfect"),
+            pytest.param([1, 2, 3, 4], [2, 3], 3, 2 / 3, id="partial"),
+            pytest.param([1, 2, 3], [4, 5], 3, 0.0, id="zero"),
+            # k exceeds retrieved length - uses actual length
+            pytest.param([1, 2], [1], 10, 0.5, id="k_larger_than_retrieved"),
+            pytest.param([], [1, 2], 3, 0.0, id="empty_retrieved"),
+            pytest.param([1, 2, 3], [], 3, 0.0, id="empty_ground_truth"),
+        ],
+    )
+    def test_precision(self, retrieved, ground_truth, k, expected):
+        """Precision@k over representative and edge-case inputs."""
+        assert precision_at_k(retrieved, ground_truth, k=k) == pytest.approx(expected)
 
 
 class TestHitRate:
     """Test hit rate metric."""
 
-    def test_hit_first_position(self):
-        """Relevant item at first position."""
-        assert hit_rate([1, 2, 3], [1], k=3) == 1.0
-
-    def test_hit_last_position(self):
-        """Relevant item at last position within k."""
-        assert hit_rate([1, 2, 3], [3], k=3) == 1.0
-
-    def test_no_hit(self):
-        """No relevant items in top-k."""
-        assert hit_rate([1, 2, 3], [4, 5], k=3) == 0.0
-
-    def test_hit_beyond_k(self):
-        """Relevant item exists but beyond k."""
-        assert hit_rate([1, 2, 3, 4], [4], k=2) == 0.0
-
-    def test_multiple_hits(self):
-        """Multiple relevant items - still returns 1.0."""
-        assert hit_rate([1, 2, 3], [1, 2, 3], k=3) == 1.0
-
-    def test_empty_lists(self):
-        """Edge cases with empty lists."""
-        assert hit_rate([], [1], k=3) == 0.0
-        assert hit_rate([1], [], k=3) == 0.0
+    @pytest.mark.parametrize(
+        ("retrieved", "ground_truth", "k", "expected"),
+        [
+            pytest.param([1, 2, 3], [1], 3, 1.0, id="first_position"),
+            pytest.param([1, 2, 3], [3], 3, 1.0, id="last_position"),
+            pytest.param([1, 2, 3], [4, 5], 3, 0.0, id="no_hit"),
+            pytest.param([1, 2, 3, 4], [4], 2, 0.0, id="hit_beyond_k"),
+            # Multiple relevant items - still returns 1.0
+            pytest.param([1, 2, 3], [1, 2, 3], 3, 1.0, id="multiple_hits"),
+            pytest.param([], [1], 3, 0.0, id="empty_retrieved"),
+            pytest.param([1], [], 3, 0.0, id="empty_ground_truth"),
+        ],
+    )
+    def test_hit_rate(self, retrieved, ground_truth, k, expected):
+        """Hit rate over representative and edge-case inputs."""
+        assert hit_rate(retrieved, ground_truth, k=k) == expected
 
 
 class TestMRR:
     """Test Mean Reciprocal Rank metric."""
 
-    def test_first_position(self):
-        """Relevant item at rank 1."""
-        assert mrr([1, 2, 3], [1]) == 1.0
-
-    def test_second_position(self):
-        """Relevant item at rank 2."""
-        assert mrr([1, 2, 3], [2]) == 0.5
-
-    def test_third_position(self):
-        """Relevant item at rank 3."""
-        result = mrr([1, 2, 3], [3])
-        assert result is not None
-        assert abs(result - 1 / 3) < 0.001
-
-    def test_multiple_relevant_uses_first(self):
-        """Multiple relevant items - uses first occurrence."""
-        assert mrr([1, 2, 3, 4], [3, 2]) == 0.5  # First hit at rank 2
-
-    def test_no_relevant_items(self):
-        """No relevant items found - returns None."""
-        assert mrr([1, 2, 3], [4, 5]) is None
-
-    def test_empty_retrieved(self):
-        """No items retrieved."""
-        assert mrr([], [1, 2]) is None
-
-    def test_empty_ground_truth(self):
-        """No ground truth items."""
-        assert mrr([1, 2, 3], []) is None
+    @pytest.mark.parametrize(
+        ("retrieved", "ground_truth", "expected"),
+        [
+            pytest.param([1, 2, 3], [1], 1.0, id="first_position"),
+            pytest.param([1, 2, 3], [2], 0.5, id="second_position"),
+            pytest.param([1, 2, 3], [3], 1 / 3, id="third_position"),
+            # Multiple relevant items - uses first occurrence at rank 2
+            pytest.param([1, 2, 3, 4], [3, 2], 0.5, id="multiple_relevant_uses_first"),
+            pytest.param([1, 2, 3], [4, 5], None, id="no_relevant_items"),
+            pytest.param([], [1, 2], None, id="empty_retrieved"),
+            pytest.param([1, 2, 3], [], None, id="empty_ground_truth"),
+        ],
+    )
+    def test_mrr(self, retrieved, ground_truth, expected):
+        """MRR over representative and edge-case inputs; None means no match."""
+        result = mrr(retrieved, ground_truth)
+        if expected is None:
+            assert result is None
+        else:
+            assert result == pytest.approx(expected)
 
 
 class TestNDCGAtK:
     """Test NDCG@k metric."""
 
-    def test_perfect_ranking(self):
-        """All relevant items at top positions."""
+    @pytest.mark.parametrize(
+        ("retrieved", "ground_truth", "k", "expected"),
+        [
+            pytest.param([1, 2, 3, 4], [1, 2], 4, 1.0, id="perfect_ranking"),
+            # [1, 2, 3] with ground truth [2, 3]
+            # DCG = 0 + 1/log2(3) + 1/log2(4) ≈ 0.630 + 0.5 = 1.130
+            # IDCG = 1/log2(2) + 1/log2(3) = 1.0 + 0.630 = 1.630
+            # NDCG = 1.130 / 1.630 ≈ 0.693
+            pytest.param([1, 2, 3], [2, 3], 3, 0.693, id="imperfect_ranking"),
+            pytest.param([1, 2, 3], [4, 5], 3, 0.0, id="no_relevant_items"),
+            pytest.param([1, 2, 3], [1], 3, 1.0, id="single_relevant_at_top"),
+            # Perfect ranking: ground truth [1, 2] at positions 1, 2
+            pytest.param([1, 2, 3, 4, 5], [1, 2], 10, 1.0, id="k_larger_than_ground_truth"),
+            pytest.param([], [1, 2], 3, 0.0, id="empty_retrieved"),
+            pytest.param([1, 2], [], 3, 0.0, id="empty_ground_truth"),
+            pytest.param([1, 2, 3, 4], [4], 2, 0.0, id="relevant_beyond_k"),
+        ],
+    )
+    def test_ndcg(self, retrieved, ground_truth, k, expected):
+        """NDCG@k over representative and edge-case inputs."""
+        assert ndcg_at_k(retrieved, ground_truth, k=k) == pytest.approx(expected, abs=1e-3)
+
+    def test_perfect_ranking_is_exact(self):
+        """Perfect rankings score exactly 1.0, not merely approximately."""
         assert ndcg_at_k([1, 2, 3, 4], [1, 2], k=4) == 1.0
 
-    def test_imperfect_ranking(self):
-        """Relevant items not optimally ranked."""
-        # [1, 2, 3] with ground truth [2, 3]
-        # DCG = 0 + 1/log2(3) + 1/log2(4) ≈ 0.630 + 0.5 = 1.130
-        # IDCG = 1/log2(2) + 1/log2(3) = 1.0 + 0.630 = 1.630
-        # NDCG = 1.130 / 1.630 ≈ 0.693
-        result = ndcg_at_k([1, 2, 3], [2, 3], k=3)
-        assert 0.69 < result < 0.70
-
-    def test_no_relevant_items(self):
-        """No relevant items in top-k."""
-        assert ndcg_at_k([1, 2, 3], [4, 5], k=3) == 0.0
-
-    def test_single_relevant_at_top(self):
-        """Single relevant item at rank 1."""
-        assert ndcg_at_k([1, 2, 3], [1], k=3) == 1.0
-
-    def test_k_larger_than_ground_truth(self):
-        """k exceeds number of ground truth items."""
-        # Perfect ranking: ground truth [1, 2] at positions 1, 2
-        assert ndcg_at_k([1, 2, 3, 4, 5], [1, 2], k=10) == 1.0
-
-    def test_empty_lists(self):
-        """Edge cases with empty lists."""
-        assert ndcg_at_k([], [1, 2], k=3) == 0.0
-        assert ndcg_at_k([1, 2], [], k=3) == 0.0
-
-    def test_relevant_beyond_k(self):
-        """Relevant items exist but beyond k."""
-        assert ndcg_at_k([1, 2, 3, 4], [4], k=2) == 0.0
+    def test_k_beyond_discount_table(self):
+        """k larger than the precomputed discount table still scores correctly."""
+        table_size = len(retrieval_module._LOG2_DISCOUNTS)
+        retrieved = list(range(20_000))
+        assert ndcg_at_k(retrieved, retrieved, k=20_000) == 1.0
+        # Oversized requests get a one-off table; the shared one stays put
+        assert len(retrieval_module._LOG2_DISCOUNTS) == table_size
 
 
 class TestComputeRetrievalMetrics:
@@ -283,6 +249,134 @@ class TestComputeRetrievalMetrics:
         assert isinstance(metrics.num_ground_truth, int)
         assert isinstance(metrics.num_relevant_retrieved, int)
 
+    def test_matches_individual_metrics(self):
+        """Fused computation agrees with each standalone metric function."""
+        rng = random.Random(1)
+        for _ in range(200):
+            retrieved = [rng.randint(0, 20) for _ in range(rng.randint(0, 10))]
+            ground_truth = [rng.randint(0, 20) for _ in range(rng.randint(0, 4))]
+            k = rng.randint(1, 12)
+
+            metrics = compute_retrieval_metrics(retrieved, ground_truth, k)
+            assert metrics.recall_at_k == recall_at_k(retrieved, ground_truth, k)
+            assert metrics.precision_at_k == precision_at_k(retrieved, ground_truth, k)
+            assert metrics.hit_rate == hit_rate(retrieved, ground_truth, k)
+            assert metrics.mrr == mrr(retrieved, ground_truth)
+            assert metrics.ndcg_at_k == pytest.approx(ndcg_at_k(retrieved, ground_truth, k))
+
+    def test_dataclass_is_frozen(self):
+        """Metrics are immutable once computed."""
+        metrics = compute_retrieval_metrics([1, 2, 3], [2], k=3)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            metrics.recall_at_k = 0.0  # type: ignore[misc]
+
+
+class TestComputeRetrievalMetricsBatch:
+    """Test the vectorized batch compute function."""
+
+    def test_matches_per_query(self):
+        """Batch results agree with per-query computation, including edge cases."""
+        rng = random.Random(0)
+        retrieved = [[rng.randint(0, 30) for _ in range(rng.randint(0, 12))] for _ in range(200)]
+        ground_truth = [[rng.randint(0, 30) for _ in range(rng.randint(0, 5))] for _ in range(200)]
+        retrieved += [[], [1, 1, 2, 2, 3], [1, 2, 3]]
+        ground_truth += [[], [1, 2], [1, 2, 3]]
+
+        for k in (1, 3, 10, 50):
+            batch = compute_retrieval_metrics_batch(retrieved, ground_truth, k)
+            assert len(batch) == len(retrieved)
+            for metrics, r, g in zip(batch, retrieved, ground_truth):
+                expected = compute_retrieval_metrics(r, g, k)
+                assert metrics.recall_at_k == pytest.approx(expected.recall_at_k)
+                assert metrics.precision_at_k == pytest.approx(expected.precision_at_k)
+                assert metrics.hit_rate == expected.hit_rate
+                assert metrics.mrr == pytest.approx(expected.mrr)
+                assert metrics.ndcg_at_k == pytest.approx(expected.ndcg_at_k)
+                assert metrics.num_retrieved == expected.num_retrieved
+                assert metrics.num_ground_truth == expected.num_ground_truth
+                assert metrics.num_relevant_retrieved == expected.num_relevant_retrieved
+
+    def test_perfect_ranking_is_exact(self):
+        """Perfect rankings score exactly 1.0 NDCG."""
+        [metrics] = compute_retrieval_metrics_batch([[1, 2, 3, 4]], [[1, 2]], k=4)
+        assert metrics.ndcg_at_k == 1.0
+
+    def test_empty_batch(self):
+        """No queries yields no results."""
+        batch = compute_retrieval_metrics_batch([], [], k=3)
+        assert len(batch) == 0
+        assert list(batch) == []
+
+    def test_to_records(self):
+        """Record array holds one contiguous struct per query."""
+        batch = compute_retrieval_metrics_batch([[1, 2, 3], [4, 5]], [[2], [6]], k=3)
+        records = batch.to_records()
+
+        assert records.dtype == METRICS_DTYPE
+        assert records.shape == (2,)
+        assert records[0].mrr == 0.5
+        assert np.isnan(records[1].mrr)
+        assert list(records.num_relevant_retrieved) == [1, 0]
+
+    def test_validation(self):
+        """Raises error for invalid k or mismatched inputs."""
+        with pytest.raises(ValueError, match="k must be >= 1"):
+            compute_retrieval_metrics_batch([[1]], [[1]], k=0)
+
+        with pytest.raises(ValueError, match="same length"):
+            compute_retrieval_metrics_batch([[1], [2]], [[1]], k=3)
+
+
+@pytest.fixture
+def numba_metrics():
+    """Enable the Numba metric backend for one test."""
+    pytest.importorskip("numba")
+    activate_numba_metrics()
+    yield
+    activate_numba_metrics(enabled=False)
+
+
+class TestNumbaBackend:
+    """Test the optional Numba-compiled metric backend."""
+
+    def test_matches_python_backend(self, numba_metrics):
+        """JIT results agree with the pure-Python metrics, including edge cases."""
+        rng = random.Random(0)
+        cases = [
+            ([rng.randint(0, 30) for _ in range(rng.randint(0, 12))],
+             [rng.randint(0, 30) for _ in range(rng.randint(0, 5))])
+            for _ in range(200)
+        ]
+        cases += [([], []), ([1, 1, 2, 2, 3], [1, 2]), ([1, 2, 3, 4], [1, 2])]
+
+        for k in (1, 3, 10):
+            for retrieved, ground_truth in cases:
+                metrics = compute_retrieval_metrics(retrieved, ground_truth, k)
+                activate_numba_metrics(enabled=False)
+                expected = compute_retrieval_metrics(retrieved, ground_truth, k)
+                activate_numba_metrics()
+
+                assert metrics.recall_at_k == pytest.approx(expected.recall_at_k)
+                assert metrics.precision_at_k == pytest.approx(expected.precision_at_k)
+                assert metrics.hit_rate == expected.hit_rate
+                assert metrics.mrr == pytest.approx(expected.mrr)
+                assert metrics.ndcg_at_k == pytest.approx(expected.ndcg_at_k)
+                assert metrics.num_relevant_retrieved == expected.num_relevant_retrieved
+
+    def test_perfect_ranking_is_exact(self, numba_metrics):
+        """Perfect rankings score exactly 1.0 NDCG."""
+        metrics = compute_retrieval_metrics([1, 2, 3, 4], [1, 2], k=4)
+        assert metrics.ndcg_at_k == 1.0
+        assert metrics.mrr == 1.0
+
+    def test_huge_k(self, numba_metrics):
+        """Discounts are sized by the lists, not by k."""
+        table_size = len(retrieval_module._LOG2_DISCOUNTS)
+        metrics = compute_retrieval_metrics([1, 2], [1], k=50_000_000)
+        assert metrics.ndcg_at_k == 1.0
+        assert metrics.precision_at_k == 0.5
+        assert len(retrieval_module._LOG2_DISCOUNTS) == table_size
+
 
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
@@ -307,6 +401,15 @@ class TestEdgeCases:
         assert metrics.recall_at_k == 1.0
         assert metrics.precision_at_k == 0.5
 
+    def test_huge_k_batch(self):
+        """Batch discounts are sized by the lists, not by k."""
+        table_size = len(retrieval_module._LOG2_DISCOUNTS)
+        batch = compute_retrieval_metrics_batch([[1, 2], [3]], [[1], [4, 5]], k=50_000_000)
+
+        assert list(batch.ndcg_at_k) == [1.0, 0.0]
+        assert list(batch.precision_at_k) == [0.5, 0.0]
+        assert len(retrieval_module._LOG2_DISCOUNTS) == table_size
+
     def test_k_equals_one(self):
         """Minimum valid k value."""
         metrics = compute_retrieval_metrics(
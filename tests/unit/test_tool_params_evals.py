@@ -6,7 +6,10 @@ filter parameters (speaker, date, etc.) from natural language queries.
 Run with: pytest tests/unit/test_tool_params_evals.py -v --tb=short
 """
 
+import random
+
 import pytest
+from hypothesis import given, settings, strategies as st
 
 from evals.tasks.tool_params.dataset import (
     EVAL_CASES,
@@ -14,7 +17,10 @@ from evals.tasks.tool_params.dataset import (
     ToolParamsDataset,
 )
 from evals.tasks.tool_params.metrics import (
+    VECTORIZED_MIN_RESULTS,
     ToolParamsMetrics,
+    _count_filter_outcomes,
+    _count_filter_outcomes_vectorized,
     compute_tool_params_metrics,
     format_detailed_results,
     format_metrics_report,
@@ -25,59 +31,65 @@ from evals.tasks.tool_params.types import ToolParamsEvalResult
 class TestToolParamsDataset:
     """Tests for the tool parameter evaluation dataset."""
 
-    def test_dataset_has_cases(self):
+    def test_dataset_has_cases(self, tool_params_dataset: ToolParamsDataset):
         """Dataset should contain evaluation cases."""
-        dataset = ToolParamsDataset()
-        assert len(dataset) > 0
+        assert len(tool_params_dataset) > 0
 
-    def test_dataset_iteration(self):
+    def test_dataset_iteration(self, tool_params_dataset: ToolParamsDataset):
         """Should be able to iterate over cases."""
-        dataset = ToolParamsDataset()
-        cases = list(dataset)
+        cases = list(tool_params_dataset)
         assert len(cases) == len(EVAL_CASES)
 
-    def test_filter_by_category(self):
+    def test_custom_cases_are_snapshotted(self):
+        """Later changes to the source list should not leak into the dataset."""
+        source = list(EVAL_CASES[:3])
+        dataset = ToolParamsDataset(source)
+        source.append(EVAL_CASES[3])
+
+        assert dataset.cases == tuple(EVAL_CASES[:3])
+        assert len(dataset) == 3
+        assert dataset.get_by_id(EVAL_CASES[3].id) is None
+
+    def test_filter_by_category(self, tool_params_dataset: ToolParamsDataset):
         """Should filter cases by category."""
-        dataset = ToolParamsDataset()
-        speaker_cases = dataset.by_category("speaker_filter")
+        speaker_cases = tool_params_dataset.by_category("speaker_filter")
         assert len(speaker_cases) > 0
         for case in speaker_cases:
             assert case.category == "speaker_filter"
 
-    def test_get_by_id(self):
+    def test_filter_by_unknown_category(self, tool_params_dataset: ToolParamsDataset):
+        """Should return an empty list for a category with no cases."""
+        assert tool_params_dataset.by_category("nonexistent_category") == []
+
+    def test_get_by_id(self, tool_params_dataset: ToolParamsDataset):
         """Should retrieve case by ID."""
-        dataset = ToolParamsDataset()
-        case = dataset.get_by_id("speaker_001")
+        case = tool_params_dataset.get_by_id("speaker_001")
         assert case is not None
         assert case.id == "speaker_001"
 
-    def test_get_by_id_not_found(self):
+    def test_get_by_id_not_found(self, tool_params_dataset: ToolParamsDataset):
         """Should return None for unknown ID."""
-        dataset = ToolParamsDataset()
-        case = dataset.get_by_id("nonexistent_case")
+        case = tool_params_dataset.get_by_id("nonexistent_case")
         assert case is None
 
-    def test_all_cases_have_required_fields(self):
+    def test_all_cases_have_required_fields(self, tool_params_dataset: ToolParamsDataset):
         """All cases should have required fields."""
-        dataset = ToolParamsDataset()
-        for case in dataset:
+        for case in tool_params_dataset:
             assert case.id, "Case must have an id"
             assert case.query, "Case must have a query"
             assert case.expected_filters is not None, "Case must have expected_filters"
             assert case.description, "Case must have a description"
 
-    def test_categories_list(self):
+    def test_categories_list(self, tool_params_dataset: ToolParamsDataset):
         """Should return list of unique categories."""
-        dataset = ToolParamsDataset()
-        categories = dataset.categories()
+        categories = tool_params_dataset.categories()
         assert len(categories) > 0
         assert "speaker_filter" in categories
         assert "no_speaker_filter" in categories
 
-    def test_count_property(self):
+    def test_count_property(self, tool_params_dataset: ToolParamsDataset):
         """Should return count of cases."""
-        dataset = ToolParamsDataset()
-        assert dataset.count == len(EVAL_CASES)
+        assert tool_params_dataset.count == len(EVAL_CASES)
 
 
 class TestExpectedFilters:
@@ -114,65 +126,42 @@ class TestExpectedFilters:
         assert filters.end_date == "2024-12-31"
 
 
-class TestMetricsComputation:
-    """Tests for metrics computation."""
-
-    def test_compute_metrics_empty_results(self):
-        """Should handle empty results list."""
-        metrics = compute_tool_params_metrics([])
-        assert metrics.total_cases == 0
-        assert metrics.overall_accuracy == 0.0
-
-    def test_compute_metrics_all_passed(self):
-        """Should calculate 100% accuracy when all pass."""
-        results = [
-            ToolParamsEvalResult(
-                case_id="test_1",
-                query="test query 1",
-                expected_filters=ExpectedFilters(speaker="John"),
-                actual_filters={"speaker": "John"},
-                tool_calls=[],
-                filter_matches={"speaker": True},
-                overall_match=True,
-            ),
-            ToolParamsEvalResult(
-                case_id="test_2",
-                query="test query 2",
-                expected_filters=ExpectedFilters(speaker="Jane"),
-                actual_filters={"speaker": "Jane"},
-                tool_calls=[],
-                filter_matches={"speaker": True},
-                overall_match=True,
-            ),
-        ]
-        metrics = compute_tool_params_metrics(results)
-        assert metrics.total_cases == 2
-        assert metrics.passed == 2
-        assert metrics.failed == 0
-        assert metrics.overall_accuracy == 1.0
-
-    def test_compute_metrics_all_failed(self):
-        """Should calculate 0% accuracy when all fail."""
-        results = [
-            ToolParamsEvalResult(
-                case_id="test_1",
-                query="test query 1",
-                expected_filters=ExpectedFilters(speaker="John"),
-                actual_filters={},  # No speaker extracted
-                tool_calls=[],
-                filter_matches={"speaker": False},
-                overall_match=False,
-            ),
-        ]
-        metrics = compute_tool_params_metrics(results)
-        assert metrics.total_cases == 1
-        assert metrics.passed == 0
-        assert metrics.failed == 1
-        assert metrics.overall_accuracy == 0.0
-
-    def test_compute_metrics_with_errors(self):
-        """Should track error cases separately."""
-        results = [
+def _speaker_result(case_id: str, expected: str | None, actual: str | None, match: bool):
+    """Build a speaker-only result whose overall match mirrors the filter match."""
+    return ToolParamsEvalResult(
+        case_id=case_id,
+        query=f"query for {case_id}",
+        expected_filters=ExpectedFilters(speaker=expected),
+        actual_filters={"speaker": actual} if actual is not None else {},
+        tool_calls=[],
+        filter_matches={"speaker": match},
+        overall_match=match,
+    )
+
+
+METRICS_CASES = [
+    pytest.param(
+        list,
+        {"total_cases": 0, "passed": 0, "failed": 0, "errors": 0, "overall_accuracy": 0.0},
+        id="empty_results",
+    ),
+    pytest.param(
+        lambda: [
+            _speaker_result("test_1", "John", "John", True),
+            _speaker_result("test_2", "Jane", "Jane", True),
+        ],
+        {"total_cases": 2, "passed": 2, "failed": 0, "errors": 0, "overall_accuracy": 1.0},
+        id="all_passed",
+    ),
+    pytest.param(
+        # No speaker extracted
+        lambda: [_speaker_result("test_1", "John", None, False)],
+        {"total_cases": 1, "passed": 0, "failed": 1, "errors": 0, "overall_accuracy": 0.0},
+        id="all_failed",
+    ),
+    pytest.param(
+        # Errors shouldn't count toward pass/fail
+        lambda: [
             ToolParamsEvalResult(
                 case_id="test_1",
                 query="test query",
@@ -183,57 +172,35 @@ class TestMetricsComputation:
                 overall_match=False,
                 error="Test error",
             ),
-        ]
-        metrics = compute_tool_params_metrics(results)
-        assert metrics.errors == 1
-        # Errors shouldn't count toward pass/fail
-        assert metrics.passed == 0
-        assert metrics.failed == 0
+        ],
+        {"total_cases": 1, "passed": 0, "failed": 0, "errors": 1},
+        id="with_errors",
+    ),
+]
+
+
+class TestMetricsComputation:
+    """Tests for metrics computation."""
+
+    @pytest.mark.parametrize(("build_results", "expected"), METRICS_CASES)
+    def test_compute_metrics_summary(self, build_results, expected):
+        """Should count passes, failures and errors and derive accuracy."""
+        metrics = compute_tool_params_metrics(build_results())
+        for name, value in expected.items():
+            assert getattr(metrics, name) == value, name
 
     def test_filter_metrics_precision_recall(self):
         """Should calculate precision and recall correctly."""
         # Create results with known TP, FP, FN, TN for speaker filter
         results = [
             # True Positive: expected speaker, got correct speaker
-            ToolParamsEvalResult(
-                case_id="tp_1",
-                query="what did John say",
-                expected_filters=ExpectedFilters(speaker="John"),
-                actual_filters={"speaker": "John"},
-                tool_calls=[],
-                filter_matches={"speaker": True},
-                overall_match=True,
-            ),
+            _speaker_result("tp_1", "John", "John", True),
             # False Negative: expected speaker, didn't get it
-            ToolParamsEvalResult(
-                case_id="fn_1",
-                query="what did Jane say",
-                expected_filters=ExpectedFilters(speaker="Jane"),
-                actual_filters={},
-                tool_calls=[],
-                filter_matches={"speaker": False},
-                overall_match=False,
-            ),
+            _speaker_result("fn_1", "Jane", None, False),
             # False Positive: didn't expect speaker, got one
-            ToolParamsEvalResult(
-                case_id="fp_1",
-                query="what is AI",
-                expected_filters=ExpectedFilters(speaker=None),
-                actual_filters={"speaker": "Random"},
-                tool_calls=[],
-                filter_matches={"speaker": False},
-                overall_match=False,
-            ),
+            _speaker_result("fp_1", None, "Random", False),
             # True Negative: didn't expect speaker, didn't get one
-            ToolParamsEvalResult(
-                case_id="tn_1",
-                query="explain transformers",
-                expected_filters=ExpectedFilters(speaker=None),
-                actual_filters={},
-                tool_calls=[],
-                filter_matches={"speaker": True},
-                overall_match=True,
-            ),
+            _speaker_result("tn_1", None, None, True),
         ]
 
         metrics = compute_tool_params_metrics(results)
@@ -254,6 +221,60 @@ class TestMetricsComputation:
         # Accuracy = (TP + TN) / Total = 2/4 = 0.5
         assert speaker_metrics.accuracy == 0.5
 
+    @settings(max_examples=50, deadline=None)
+    @given(
+        st.lists(
+            st.tuples(
+                st.sampled_from([None, "John", "Jane"]),
+                st.sampled_from([None, "John", "Jane"]),
+            ),
+            min_size=1,
+            max_size=50,
+        )
+    )
+    def test_filter_metrics_precision_recall_property(self, pairs):
+        """Speaker metrics should agree with a reference tally for any outcome mix."""
+        results = [
+            _speaker_result(f"case_{i}", expected, actual, expected == actual)
+            for i, (expected, actual) in enumerate(pairs)
+        ]
+
+        tp = sum(e is not None and e == a for e, a in pairs)
+        tn = sum(e is None and a is None for e, a in pairs)
+        fn = sum(e is not None and a is None for e, a in pairs)
+        fp = len(pairs) - tp - tn - fn
+
+        speaker_metrics = compute_tool_params_metrics(results).filter_metrics["speaker"]
+
+        assert (
+            speaker_metrics.true_positives,
+            speaker_metrics.true_negatives,
+            speaker_metrics.false_positives,
+            speaker_metrics.false_negatives,
+        ) == (tp, tn, fp, fn)
+        assert speaker_metrics.precision == pytest.approx(tp / (tp + fp) if tp + fp else 0.0)
+        assert speaker_metrics.recall == pytest.approx(tp / (tp + fn) if tp + fn else 0.0)
+        assert speaker_metrics.accuracy == pytest.approx((tp + tn) / len(pairs))
+
+    def test_filter_metrics_precision_recall_large(self):
+        """Vectorized tallies should match the scalar path on large result sets."""
+        rng = random.Random(0)
+        speakers = [None, "John", "Jane"]
+        results = []
+        for i in range(10_000):
+            result = _speaker_result(
+                f"case_{i}", rng.choice(speakers), rng.choice(speakers), rng.random() < 0.5
+            )
+            if rng.random() < 0.05:
+                result.error = "Test error"
+            results.append(result)
+
+        assert len(results) > VECTORIZED_MIN_RESULTS
+        for filter_name in ("speaker", "start_date"):
+            assert _count_filter_outcomes_vectorized(
+                filter_name, results
+            ) == _count_filter_outcomes(filter_name, results)
+
 
 class TestMetricsFormatting:
     """Tests for metrics report formatting."""
@@ -299,33 +320,29 @@ class TestMetricsFormatting:
 class TestEvalCaseCoverage:
     """Tests to verify eval case coverage."""
 
-    def test_speaker_filter_cases_have_speakers(self):
+    def test_speaker_filter_cases_have_speakers(self, tool_params_dataset: ToolParamsDataset):
         """Speaker filter cases should expect a speaker."""
-        dataset = ToolParamsDataset()
-        for case in dataset.by_category("speaker_filter"):
+        for case in tool_params_dataset.by_category("speaker_filter"):
             assert case.expected_filters.speaker is not None, (
                 f"Case {case.id} in speaker_filter category should expect a speaker"
             )
 
-    def test_no_speaker_cases_have_no_speaker(self):
+    def test_no_speaker_cases_have_no_speaker(self, tool_params_dataset: ToolParamsDataset):
         """No speaker filter cases should not expect a speaker."""
-        dataset = ToolParamsDataset()
-        for case in dataset.by_category("no_speaker_filter"):
+        for case in tool_params_dataset.by_category("no_speaker_filter"):
             assert case.expected_filters.speaker is None, (
                 f"Case {case.id} in no_speaker_filter category should not expect a speaker"
             )
 
-    def test_case_ids_are_unique(self):
+    def test_case_ids_are_unique(self, tool_params_dataset: ToolParamsDataset):
         """All case IDs should be unique."""
-        dataset = ToolParamsDataset()
-        ids = [case.id for case in dataset]
+        ids = [case.id for case in tool_params_dataset]
         assert len(ids) == len(set(ids)), "Case IDs must be unique"
 
-    def test_minimum_cases_per_category(self):
+    def test_minimum_cases_per_category(self, tool_params_dataset: ToolParamsDataset):
         """Each category should have at least 2 cases."""
-        dataset = ToolParamsDataset()
-        for category in dataset.categories():
-            cases = dataset.by_category(category)
+        for category in tool_params_dataset.categories():
+            cases = tool_params_dataset.by_category(category)
             assert len(cases) >= 2, (
                 f"Category {category} should have at least 2 cases, has {len(cases)}"
             )
@@ -1,10 +1,14 @@
 """Unit tests for TranscriptLoader."""
 
-import tempfile
+import dataclasses
+import json
+import os
+import re
 from pathlib import Path
 
 import pytest
 
+from evals.tasks.retrieval.loaders import transcript_loader as loader_module
 from evals.tasks.retrieval.loaders.transcript_loader import (
     Transcript,
     TranscriptLoader,
@@ -16,11 +20,6 @@ from evals.schemas.task import EvalDataset
 class TestTranscriptLoader:
     """Unit tests for TranscriptLoader class."""
 
-    @pytest.fixture
-    def loader(self) -> TranscriptLoader:
-        """Create a TranscriptLoader instance using the real transcripts directory."""
-        return TranscriptLoader()
-
     @pytest.fixture
     def temp_loader(self, tmp_path: Path) -> TranscriptLoader:
         """Create a TranscriptLoader with a temporary directory."""
@@ -46,32 +45,46 @@ class TestTranscriptLoader:
         )
         assert transcript.filename.endswith(".md")
 
-    def test_load_nonexistent_file(self, loader: TranscriptLoader):
-        """Test error handling for missing files."""
+    def test_load_nonexistent_file(self, fs):
+        """Test error handling for missing files (on an in-memory filesystem)."""
+        fs.create_file("/transcripts/john-doe-hello.md", contents="hello")
+        fake_loader = TranscriptLoader(transcripts_dir=Path("/transcripts"))
+
         with pytest.raises(FileNotFoundError) as exc_info:
-            loader.load("nonexistent-transcript.md")
+            fake_loader.load("nonexistent-transcript.md")
 
         assert "Transcript not found" in str(exc_info.value)
         assert "Available transcripts" in str(exc_info.value)
+        assert "john-doe-hello.md" in str(exc_info.value)
 
-    def test_load_empty_file(self, temp_loader: TranscriptLoader, tmp_path: Path):
-        """Test error handling for empty files."""
-        # Create an empty file
-        empty_file = tmp_path / "empty-transcript.md"
-        empty_file.write_text("")
+    def test_load_empty_file(self, fs):
+        """Test error handling for empty files (on an in-memory filesystem)."""
+        fs.create_file("/transcripts/empty-transcript.md", contents="")
+        fake_loader = TranscriptLoader(transcripts_dir=Path("/transcripts"))
 
         with pytest.raises(ValueError) as exc_info:
-            temp_loader.load("empty-transcript.md")
+            fake_loader.load("empty-transcript.md")
 
         assert "empty" in str(exc_info.value).lower()
 
+    def test_load_rereads_modified_file(self, temp_loader: TranscriptLoader, tmp_path: Path):
+        """Test that cached reads are invalidated when a file changes."""
+        path = tmp_path / "john-doe-hello.md"
+        path.write_text("first version")
+        assert temp_loader.load(path.name).text == "first version"
+
+        path.write_text("second version")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert temp_loader.load(path.name).text == "second version"
+
     def test_load_all_transcripts(self, loader: TranscriptLoader):
         """Test loading all transcripts from the directory."""
         transcripts = loader.load_all()
 
         assert len(transcripts) >= 3  # We have 3 transcripts
-        assert all(isinstance(t, Transcript) for t in transcripts)
-        assert all(t.text for t in transcripts)
+        assert {type(t) for t in transcripts} == {Transcript}
+        assert [t.filename for t in transcripts if not t.text] == []
 
     def test_load_all_sorted(self, loader: TranscriptLoader):
         """Test that load_all returns transcripts sorted by filename."""
@@ -79,12 +92,25 @@ class TestTranscriptLoader:
         filenames = [t.filename for t in transcripts]
         assert filenames == sorted(filenames)
 
+    def test_load_all_skips_empty_files(self, temp_loader: TranscriptLoader, tmp_path: Path):
+        """Test that concurrent loading keeps sorted order and skips empty files."""
+        for name in ("c-c-third", "a-a-first", "b-b-empty", "d-d-fourth"):
+            (tmp_path / f"{name}.md").write_text("" if "empty" in name else f"{name} text")
+
+        transcripts = temp_loader.load_all()
+
+        assert [t.filename for t in transcripts] == [
+            "a-a-first.md",
+            "c-c-third.md",
+            "d-d-fourth.md",
+        ]
+
     def test_get_transcript_names(self, loader: TranscriptLoader):
         """Test getting list of transcript filenames."""
         names = loader.get_transcript_names()
 
         assert len(names) >= 3
-        assert all(name.endswith(".md") for name in names)
+        assert [name for name in names if not name.endswith(".md")] == []
         assert names == sorted(names)
 
     def test_get_transcript_names_empty_dir(self, temp_loader: TranscriptLoader):
@@ -92,6 +118,39 @@ class TestTranscriptLoader:
         names = temp_loader.get_transcript_names()
         assert names == []
 
+    def test_get_transcript_names_tracks_directory_changes(
+        self, temp_loader: TranscriptLoader, tmp_path: Path
+    ):
+        """Test the cached listing is refreshed when files are added or removed."""
+        (tmp_path / "b-b-second.md").write_text("text")
+        (tmp_path / ".hidden.md").write_text("text")
+        (tmp_path / "notes.txt").write_text("text")
+        # Matches Path.glob("*.md"), which includes dotfiles
+        assert temp_loader.get_transcript_names() == [".hidden.md", "b-b-second.md"]
+
+        def bump_mtime():
+            stat = tmp_path.stat()
+            os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        (tmp_path / "a-a-first.md").write_text("text")
+        bump_mtime()
+        assert temp_loader.get_transcript_names() == [
+            ".hidden.md",
+            "a-a-first.md",
+            "b-b-second.md",
+        ]
+
+        (tmp_path / "b-b-second.md").unlink()
+        bump_mtime()
+        assert temp_loader.get_transcript_names() == [".hidden.md", "a-a-first.md"]
+        assert temp_loader.get_transcript_names() == sorted(
+            p.name for p in tmp_path.glob("*.md")
+        )
+
+    def test_get_transcript_names_missing_dir(self, tmp_path: Path):
+        """Test a missing transcripts directory yields no names."""
+        assert TranscriptLoader(transcripts_dir=tmp_path / "missing").get_transcript_names() == []
+
 
 class TestFilenameParser:
     """Unit tests for filename parsing logic."""
@@ -155,14 +214,9 @@ class TestFilenameParser:
 class TestTranscriptSearch:
     """Unit tests for transcript search functionality."""
 
-    @pytest.fixture
-    def loader(self) -> TranscriptLoader:
-        """Create a TranscriptLoader instance."""
-        return TranscriptLoader()
-
-    def test_search_text_finds_matches(self, loader: TranscriptLoader):
+    def test_search_text_finds_matches(self, loader: TranscriptLoader, corpus: list[Transcript]):
         """Test that search finds matching lines."""
-        results = loader.search_text("agents")
+        results = loader.search_text("agents", transcripts=corpus)
 
         assert len(results) > 0
         for transcript, matches in results:
@@ -170,20 +224,20 @@ class TestTranscriptSearch:
             assert len(matches) > 0
             assert all("agent" in m.lower() for m in matches)
 
-    def test_search_text_case_insensitive(self, loader: TranscriptLoader):
+    def test_search_text_case_insensitive(self, loader: TranscriptLoader, corpus: list[Transcript]):
         """Test case-insensitive search."""
-        results_lower = loader.search_text("agents", case_sensitive=False)
-        results_upper = loader.search_text("AGENTS", case_sensitive=False)
+        results_lower = loader.search_text("agents", case_sensitive=False, transcripts=corpus)
+        results_upper = loader.search_text("AGENTS", case_sensitive=False, transcripts=corpus)
 
         # Should find same transcripts
         transcripts_lower = {t.filename for t, _ in results_lower}
         transcripts_upper = {t.filename for t, _ in results_upper}
         assert transcripts_lower == transcripts_upper
 
-    def test_search_text_case_sensitive(self, loader: TranscriptLoader):
+    def test_search_text_case_sensitive(self, loader: TranscriptLoader, corpus: list[Transcript]):
         """Test case-sensitive search."""
-        results_exact = loader.search_text("The", case_sensitive=True)
-        results_wrong = loader.search_text("THE", case_sensitive=True)
+        results_exact = loader.search_text("The", case_sensitive=True, transcripts=corpus)
+        results_wrong = loader.search_text("THE", case_sensitive=True, transcripts=corpus)
 
         # Case sensitive search for "The" should find more than "THE"
         # (since transcripts use standard capitalization)
@@ -191,28 +245,80 @@ class TestTranscriptSearch:
         matches_wrong = sum(len(m) for _, m in results_wrong)
         assert matches_exact >= matches_wrong
 
+    def test_search_text_reports_each_line_once(self, tmp_path: Path):
+        """Test that lines with several hits are reported once, in order."""
+        text = "  Agents and agents  \nnothing here\r\nlast line about AGENTS"
+        (tmp_path / "john-doe-agents.md").write_text(text)
+
+        [(_, matches)] = TranscriptLoader(transcripts_dir=tmp_path).search_text("agents")
+
+        assert matches == ["Agents and agents", "last line about AGENTS"]
+
     def test_search_text_no_matches(self, loader: TranscriptLoader):
-        """Test search with no matches."""
+        """Test search with no matches, loading transcripts from disk."""
         results = loader.search_text("xyznonexistentterm123")
         assert results == []
 
+    @pytest.fixture(params=["default", "re", "re2"])
+    def regex_backend(self, request, monkeypatch):
+        """Run search_terms as configured, or force its single scan with an engine."""
+        if request.param == "default":
+            yield request.param
+            return
+        engine = re if request.param == "re" else pytest.importorskip("re2")
+        monkeypatch.setattr(loader_module, "regex_engine", engine)
+        # Force the single scan, which the stdlib engine normally skips
+        monkeypatch.setattr(loader_module, "_SINGLE_SCAN_SEARCH", True)
+        loader_module._compile_alternation.cache_clear()
+        yield request.param
+        loader_module._compile_alternation.cache_clear()
+
+    @pytest.mark.parametrize("case_sensitive", [False, True])
+    def test_search_terms_matches_search_text(
+        self,
+        loader: TranscriptLoader,
+        corpus: list[Transcript],
+        case_sensitive: bool,
+        regex_backend: str,
+    ):
+        """Test a multi-term search agrees with searching each term on its own."""
+        terms = ["agent", "attention", "reward", "The", "xyznonexistentterm123"]
+
+        results = loader.search_terms(terms, case_sensitive=case_sensitive, transcripts=corpus)
+
+        assert list(results) == terms
+        for term in terms:
+            assert results[term] == loader.search_text(
+                term, case_sensitive=case_sensitive, transcripts=corpus
+            )
+
+    def test_search_terms_overlapping_and_special_terms(self, tmp_path: Path, regex_backend: str):
+        """Test overlapping, regex-special, empty and multi-line terms."""
+        text = "Agents (and agent.) here\nno match\nagent only\nfoo\nbar"
+        (tmp_path / "john-doe-agents.md").write_text(text)
+        loader = TranscriptLoader(transcripts_dir=tmp_path)
+        terms = ["agents", "agent", "agent.)", "", "foo\nbar"]
+
+        results = loader.search_terms(terms)
+
+        for term in terms:
+            assert results[term] == loader.search_text(term), term
+        [(_, agent_lines)] = results["agent"]
+        assert agent_lines == ["Agents (and agent.) here", "agent only"]
+
 
 class TestEvalDatasetLoader:
     """Unit tests for eval dataset loading."""
 
-    def test_load_eval_dataset_default(self):
+    def test_load_eval_dataset_default(self, eval_dataset: EvalDataset):
         """Test loading default eval dataset."""
-        dataset = load_eval_dataset()
-
-        assert isinstance(dataset, EvalDataset)
-        assert dataset.version == "1.0.0"
-        assert dataset.count >= 10  # Should have 10-15 questions
+        assert isinstance(eval_dataset, EvalDataset)
+        assert eval_dataset.version == "1.0.0"
+        assert eval_dataset.count >= 10  # Should have 10-15 questions
 
-    def test_load_eval_dataset_examples(self):
+    def test_load_eval_dataset_examples(self, eval_dataset: EvalDataset):
         """Test that loaded examples have required fields."""
-        dataset = load_eval_dataset()
-
-        for example in dataset.examples:
+        for example in eval_dataset.examples:
             assert example.id.startswith("eval_")
             assert len(example.question) >= 10
             assert len(example.reference_answer) >= 10
@@ -225,11 +331,19 @@ class TestEvalDatasetLoader:
         with pytest.raises(FileNotFoundError):
             load_eval_dataset(tmp_path / "nonexistent.json")
 
-    def test_eval_dataset_by_difficulty(self):
+    def test_load_eval_dataset_matches_stdlib_json(self, eval_dataset: EvalDataset):
+        """Test the fast JSON parse builds the same dataset as the stdlib parser."""
+        default = (
+            Path(__file__).parents[2] / "evals/tasks/retrieval/datasets/eval_questions.json"
+        )
+        data = json.loads(default.read_text(encoding="utf-8"))
+        assert eval_dataset == EvalDataset(**data)
+
+    def test_eval_dataset_by_difficulty(self, eval_dataset: EvalDataset):
         """Test filtering examples by difficulty."""
         from evals.schemas.task import DifficultyLevel
 
-        dataset = load_eval_dataset()
+        dataset = eval_dataset
 
         easy = dataset.by_difficulty(DifficultyLevel.EASY)
         medium = dataset.by_difficulty(DifficultyLevel.MEDIUM)
@@ -243,11 +357,11 @@ class TestEvalDatasetLoader:
         # Total should match
         assert len(easy) + len(medium) + len(hard) == dataset.count
 
-    def test_eval_dataset_by_type(self):
+    def test_eval_dataset_by_type(self, eval_dataset: EvalDataset):
         """Test filtering examples by question type."""
         from evals.schemas.task import QuestionType
 
-        dataset = load_eval_dataset()
+        dataset = eval_dataset
 
         factual = dataset.by_type(QuestionType.FACTUAL)
         analytical = dataset.by_type(QuestionType.ANALYTICAL)
@@ -289,3 +403,23 @@ class TestTranscriptDataclass:
 
         assert t1 == t2
         assert t1 != t3
+
+    def test_transcript_is_frozen_and_hashable(self):
+        """Test Transcript instances are immutable and usable as set members."""
+        t1 = Transcript("a.md", "Speaker", "Title", "Text", "/path")
+        t2 = Transcript("a.md", "Speaker", "Title", "Text", "/path")
+
+        assert len({t1, t2}) == 1
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            t1.text = "Edited"  # type: ignore[misc]
+
+    def test_lowered_text_is_cached(self):
+        """Test the lowercase mirror is computed once and ignored by equality."""
+        t1 = Transcript("a.md", "Speaker", "Title", "Mixed CASE Text", "/path")
+        t2 = Transcript("a.md", "Speaker", "Title", "Mixed CASE Text", "/path")
+
+        lowered = t1.lowered()
+        assert lowered == "mixed case text"
+        assert t1.lowered() is lowered
+        assert t1 == t2
+        assert hash(t1) == hash(t2)